@@ -0,0 +1,8 @@
+"""Benchmarks for complendar. Run each module from the repository root:
+
+- `python -m benchmarks.run`: every pipeline stage and the end-to-end path on synthetic sheets.
+- `python -m benchmarks.bench_birthday`: the birthday parser against `strptime`.
+- `python -m benchmarks.bench_startup`: import time against the startup budget.
+
+`benchmarks.generate` builds the deterministic Google-Form-style CSVs they use.
+"""
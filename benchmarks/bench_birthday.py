@@ -0,0 +1,45 @@
+"""Microbenchmark: `_parse_birthday` against the `datetime.strptime` parser it replaced.
+
+Run from the repository root with `python -m benchmarks.bench_birthday`.
+"""
+import random
+from datetime import date, datetime
+from timeit import repeat
+from typing import Optional
+
+from complendar import _parse_birthday
+
+
+def _strptime_birthday(birthday: Optional[str]) -> Optional[date]:
+    try:
+        return datetime.strptime(birthday, "%m/%d/%Y").date()
+    except (ValueError, TypeError):
+        return None
+
+
+def _sample(rows: int, distinct: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    pool = [f"{rng.randint(1, 12)}/{rng.randint(1, 28)}/{rng.randint(1950, 2010)}" for _ in range(distinct)]
+    pool += ["13/1/2000", "2/30/2001", "not a date", ""]
+    return [rng.choice(pool) for _ in range(rows)]
+
+
+def main(rows: int = 10_000, distinct: int = 1_000, runs: int = 5):
+    birthdays = _sample(rows, distinct)
+    assert [_parse_birthday(b) for b in birthdays] == [_strptime_birthday(b) for b in birthdays]
+
+    candidates = {
+        "strptime": _strptime_birthday,
+        "fast (uncached)": _parse_birthday.__wrapped__,
+        "fast (memoized)": _parse_birthday,
+    }
+    print(f"{rows} birthdays, {distinct} distinct, best of {runs}")
+    baseline = None
+    for label, parse in candidates.items():
+        best = min(repeat(lambda: [parse(b) for b in birthdays], number=1, repeat=runs))
+        baseline = baseline or best
+        print(f"{label:>16}: {best * 1e3:8.2f} ms  ({rows / best:12,.0f} rows/s, {baseline / best:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
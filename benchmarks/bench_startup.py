@@ -0,0 +1,52 @@
+"""Startup budget: how long `import complendar` takes, measured with `python -X importtime`.
+
+Run from the repository root with `python -m benchmarks.bench_startup [budget_ms]`.
+Exits non-zero when the median import time is over budget, or when the import pulls
+in a dependency that should only be loaded on demand.
+"""
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+DEFAULT_BUDGET_MS = 150.0
+DEFERRED_MODULES = ("httpx", "ical", "pydantic", "multiprocessing")
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _import_time_ms() -> float:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import complendar"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    # Lines look like "import time:   self [us] | cumulative | imported package".
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == "complendar":
+            return int(cumulative) / 1000
+    raise RuntimeError("complendar missing from -X importtime output")
+
+
+def _eagerly_imported() -> list[str]:
+    check = f"import sys, complendar; print(*[m for m in {DEFERRED_MODULES!r} if m in sys.modules])"
+    result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True, check=True, cwd=ROOT)
+    return result.stdout.split()
+
+
+def main(budget_ms: float = DEFAULT_BUDGET_MS, runs: int = 7) -> bool:
+    timings = [_import_time_ms() for _ in range(runs)]
+    median = statistics.median(timings)
+    eager = _eagerly_imported()
+    print(f"import complendar: median {median:.1f} ms over {runs} runs (budget {budget_ms:.0f} ms)")
+    if eager:
+        print(f"imported eagerly: {', '.join(eager)}")
+    ok = median <= budget_ms and not eager
+    print("✅ within budget" if ok else "❌ over budget")
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main(*(float(arg) for arg in sys.argv[1:2])) else 1)
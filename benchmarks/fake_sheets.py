@@ -0,0 +1,233 @@
+"""A local stand-in for Google's `/spreadsheets/d/<id>/export?format=csv` endpoint.
+
+Sheets are generated with `benchmarks.generate`. Each sheet ID encodes the sheet's
+size, seed and header style (see `sheet_id`), so every link is reproducible.
+Latency, bandwidth, redirect hops, validators and failures can all be tuned, so the
+whole stack can be load-tested offline:
+
+    python -m benchmarks.fake_sheets --port 9000 --latency 0.2 --bandwidth 2000000
+    COMPLENDAR_SHEETS_BASE_URL=http://127.0.0.1:9000 python -m complendar
+"""
+import argparse
+import functools
+import gzip
+import http.server
+import random
+import threading
+import time
+import urllib.parse
+from email.utils import formatdate
+from hashlib import sha256
+from re import compile as com
+from typing import NamedTuple, Optional
+
+from benchmarks.generate import HEADER_STYLES, generate_csv
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+EXPORT_PATH = com(r"^/spreadsheets/d/(?P<spreadsheet_id>[^/]{44})/export$")
+CHUNK_SIZE = 16 * 1024
+
+
+class FakeSheetsOptions(NamedTuple):
+    default_rows: int = 1000  # for sheet IDs that do not encode a size
+    latency: float = 0.0  # seconds before the response headers
+    jitter: float = 0.0  # up to this many extra seconds of latency, uniformly random
+    bandwidth: Optional[float] = None  # body bytes per second, unlimited if None
+    redirects: int = 0  # redirect hops before the CSV, like Google's googleusercontent hop
+    etag: bool = True  # send ETag/Last-Modified and answer If-None-Match with 304
+    compress: bool = True  # gzip or br encode the CSV if the client accepts it, as Google does
+    error_rate: float = 0.0  # share of requests answered with one of `error_statuses`
+    error_statuses: tuple[int, ...] = (500, 503)
+    seed: Optional[int] = None  # for latency jitter and error injection
+
+
+def sheet_id(rows: int, seed: int = 0, header_style: str = "form") -> str:
+    """A 44-character sheet ID that the fake server turns into that sheet."""
+    return f"{rows}_{seed}_{header_style}_".ljust(44, "x")
+
+
+def sheet_link(base_url: str, rows: int, seed: int = 0, header_style: str = "form", gid: int = 0) -> str:
+    """An edit link, as users paste it, for a generated sheet."""
+    return f"{base_url.rstrip('/')}/spreadsheets/d/{sheet_id(rows, seed, header_style)}/edit#gid={gid}"
+
+
+def _parse_sheet_id(spreadsheet_id: str, default_rows: int) -> tuple[int, int, str]:
+    rows, seed, header_style, *_ = spreadsheet_id.split("_") + ["", "", ""]
+    if not (rows.isdigit() and seed.isdigit() and header_style in HEADER_STYLES):
+        return default_rows, int(sha256(spreadsheet_id.encode()).hexdigest()[:8], 16), "form"
+    return int(rows), int(seed), header_style
+
+
+def _content_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    accepted = {coding.partition(";")[0].strip() for coding in (accept_encoding or "").split(",")}
+    if "br" in accepted and brotli is not None:
+        return "br"
+    return "gzip" if "gzip" in accepted else None
+
+
+def _compress(data: bytes, encoding: str) -> bytes:
+    return brotli.compress(data, quality=5) if encoding == "br" else gzip.compress(data, mtime=0)
+
+
+class _Sheet(NamedTuple):
+    body: bytes
+    etag: str
+
+
+@functools.lru_cache(maxsize=32)
+def _sheet(rows: int, seed: int, header_style: str, gid: str, encoding: Optional[str]) -> _Sheet:
+    if encoding:
+        plain = _sheet(rows, seed, header_style, gid, None)
+        return _Sheet(_compress(plain.body, encoding), f'{plain.etag[:-1]}-{encoding}"')
+    body = generate_csv(rows, header_style=header_style, seed=seed + int(gid or 0))
+    return _Sheet(body, f'"{sha256(body).hexdigest()[:32]}"')
+
+
+class FakeSheetsHandler(http.server.BaseHTTPRequestHandler):
+    server: "FakeSheetsServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        options = self.server.options
+        url = urllib.parse.urlsplit(self.path)
+        query = urllib.parse.parse_qs(url.query)
+        m = EXPORT_PATH.match(url.path)
+        if not m or query.get("format") != ["csv"]:
+            self._send_empty(404)
+            return
+
+        self.server.sleep(options.latency + self.server.random(options.jitter))
+        if self.server.random(1.0) < options.error_rate:
+            self._send_empty(self.server.choice(options.error_statuses))
+            return
+        hop = int(query.get("hop", ["0"])[0])
+        if hop < options.redirects:
+            query["hop"] = [str(hop + 1)]
+            self.send_response(307)
+            self.send_header("Location", f"{url.path}?{urllib.parse.urlencode(query, doseq=True)}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        rows, seed, header_style = _parse_sheet_id(m["spreadsheet_id"], options.default_rows)
+        encoding = _content_encoding(self.headers.get("Accept-Encoding")) if options.compress else None
+        sheet = _sheet(rows, seed, header_style, query.get("gid", ["0"])[0], encoding)
+        if options.etag and self.headers.get("If-None-Match") == sheet.etag:
+            self.send_response(304)
+            self.send_header("ETag", sheet.etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv; charset=utf-8")
+        self.send_header("Content-Length", str(len(sheet.body)))
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        if options.etag:
+            self.send_header("ETag", sheet.etag)
+            self.send_header("Last-Modified", self.server.started)
+        self.end_headers()
+        self._write_throttled(sheet.body, options.bandwidth)
+
+    def _send_empty(self, status: int):
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _write_throttled(self, body: bytes, bandwidth: Optional[float]):
+        started = time.perf_counter()
+        try:
+            for sent in range(0, len(body), CHUNK_SIZE):
+                if bandwidth:
+                    self.server.sleep(started + sent / bandwidth - time.perf_counter())
+                self.wfile.write(body[sent:sent + CHUNK_SIZE])
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+
+class FakeSheetsServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], options: FakeSheetsOptions = FakeSheetsOptions(), verbose=False):
+        super().__init__(address, FakeSheetsHandler)
+        self.options = options
+        self.verbose = verbose
+        self.started = formatdate(usegmt=True)
+        self._random = random.Random(options.seed)
+        self._random_lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def random(self, scale: float) -> float:
+        with self._random_lock:
+            return self._random.random() * scale
+
+    def choice(self, values):
+        with self._random_lock:
+            return self._random.choice(values)
+
+    @staticmethod
+    def sleep(seconds: float):
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def start(self) -> "FakeSheetsServer":
+        """Serve on a daemon thread, e.g. from a load test; stop with `shutdown()`."""
+        threading.Thread(target=self.serve_forever, name="fake-sheets", daemon=True).start()
+        return self
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.fake_sheets", description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--rows", type=int, default=1000, help="rows of sheets whose ID does not encode a size")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds before the response headers")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many extra seconds of latency")
+    parser.add_argument("--bandwidth", type=float, help="body bytes per second (default: unlimited)")
+    parser.add_argument("--redirects", type=int, default=0, help="redirect hops before the CSV")
+    parser.add_argument("--no-etag", action="store_true", help="send no validators and never answer 304")
+    parser.add_argument("--no-compression", action="store_true", help="always send the CSV uncompressed")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests that fail")
+    parser.add_argument("--error-statuses", default="500,503", help="comma-separated statuses for failures")
+    parser.add_argument("--seed", type=int, help="seed for jitter and error injection")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+
+    options = FakeSheetsOptions(
+        default_rows=args.rows,
+        latency=args.latency,
+        jitter=args.jitter,
+        bandwidth=args.bandwidth,
+        redirects=args.redirects,
+        etag=not args.no_etag,
+        compress=not args.no_compression,
+        error_rate=args.error_rate,
+        error_statuses=tuple(int(s) for s in args.error_statuses.split(",")),
+        seed=args.seed,
+    )
+    with FakeSheetsServer((args.host, args.port), options, verbose=args.verbose) as server:
+        print(f"📄 Fake Google Sheets on {server.base_url}")
+        print(f"   Run complendar with COMPLENDAR_SHEETS_BASE_URL={server.base_url}")
+        print(f"   Example link: {sheet_link(server.base_url, 1000)}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Deterministic synthetic Google-Form CSVs.
+
+The same arguments always produce the same bytes, so results are comparable between
+commits. Sheets are generated line by line, so even a million rows are cheap to stream.
+"""
+import csv
+import io
+import random
+from typing import Iterator
+
+# Header rows seen in real form exports, from Google's defaults to hand-written questions.
+HEADER_STYLES = {
+    "form": ["Timestamp", "Email Address", "Your Name", "Your Birthday", "Anything else?"],
+    "short": ["Timestamp", "Name", "Birthday"],
+    "question": [
+        "Timestamp",
+        "What is your full name?",
+        "When is your birthday? (MM/DD/YYYY)",
+        "Which team are you on?",
+    ],
+    "shuffled": ["Birthday (M/D/Y)", "Team", "Full name", "Timestamp"],
+}
+
+_ASCII_NAMES = ["James", "Mary", "Ade", "Chloe", "Thomas", "Priya", "Lucas", "Fatima", "Noah", "Grace"]
+_UNICODE_NAMES = ["Zoë", "Søren", "Chiamaka Ọkafọ", "Łukasz", "José", "Nguyễn Văn An", "Αλέξης", "Дмитрий", "王芳", "محمد", "佐藤 花子", "Ngozi 🎉"]
+_SURNAMES = ["Smith", "Okafor", "Müller", "García", "Rossi", "Kowalski", "O'Brien", "Lee, Jr.", "Brooks"]
+_INVALID_BIRTHDAYS = ["", "13/45/2001", "2/30/1999", "tomorrow", "1990-03-04", "3/4/90", "00/00/0000"]
+
+
+def _row(rng: random.Random, header: list[str], invalid_ratio: float, unicode_ratio: float) -> list[str]:
+    first = rng.choice(_UNICODE_NAMES if rng.random() < unicode_ratio else _ASCII_NAMES)
+    name = f"{first} {rng.choice(_SURNAMES)}"
+    if rng.random() < invalid_ratio:
+        birthday = rng.choice(_INVALID_BIRTHDAYS)
+    else:
+        birthday = f"{rng.randint(1, 12)}/{rng.randint(1, 28)}/{rng.randint(1950, 2012)}"
+    values = {
+        "timestamp": f"{rng.randint(1, 12)}/{rng.randint(1, 28)}/2024 {rng.randint(0, 23)}:{rng.randint(0, 59):02}:00",
+        "email": f"user{rng.randint(1, 10**6)}@example.com",
+        "name": name,
+        "birthday": birthday,
+        "team": rng.choice(["Platform", "Design", "Sales", "Support"]),
+        "else": rng.choice(["", "", "Cake, please!", 'No "surprises"; thanks']),
+    }
+    row = []
+    for column in header:
+        lowered = column.lower()
+        if "time" in lowered:
+            row.append(values["timestamp"])
+        elif "mail" in lowered:
+            row.append(values["email"])
+        elif "birthday" in lowered:
+            row.append(values["birthday"])
+        elif "name" in lowered:
+            row.append(values["name"])
+        elif "team" in lowered:
+            row.append(values["team"])
+        else:
+            row.append(values["else"])
+    return row
+
+
+def generate_lines(
+    rows: int,
+    header_style: str = "form",
+    invalid_ratio: float = 0.05,
+    unicode_ratio: float = 0.2,
+    seed: int = 0,
+) -> Iterator[str]:
+    """Yield the CSV line by line, each terminated with CRLF like Google's export."""
+    rng = random.Random(seed)
+    header = HEADER_STYLES[header_style]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    for i in range(rows + 1):
+        if i:
+            writer.writerow(_row(rng, header, invalid_ratio, unicode_ratio))
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def generate_csv(rows: int, **options) -> bytes:
+    """The whole sheet as UTF-8 bytes; see `generate_lines` for the options."""
+    return "".join(generate_lines(rows, **options)).encode("utf-8")
@@ -0,0 +1,291 @@
+"""HTTP load test for the web server: `POST /api/convert` and `GET /download/...`.
+
+Closed-loop workers send requests back to back, in a weighted mix, for a fixed time at
+each concurrency level. Each level reports p50/p95/p99 latency, throughput and error
+rate. Ramping through several levels shows where throughput stops growing:
+
+    python -m benchmarks.loadtest --serve --concurrency 1,2,4,8,16,32 --duration 10
+
+The mix has three operations. `convert` converts a generated sheet that was never
+converted before, so it pays for a full fetch, parse and render. `reconvert` converts
+one of the warmed-up sheets again, which is mostly a 304 and a cache hit. `download`
+fetches one of the warmed-up calendars.
+
+`--serve` runs the web server and `benchmarks.fake_sheets` as subprocesses, so the test
+is offline and the load generator does not share a GIL with the server; `--latency`,
+`--jitter`, `--bandwidth` and `--no-etag` are passed on to the fake server. Without it,
+the server at `--url` should fetch from the fake server at `--sheets-url`, or give
+real links with `--link`.
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from typing import Callable, Iterator, NamedTuple, Optional
+
+import httpx
+
+from benchmarks.fake_sheets import sheet_link
+
+# A level whose throughput grew by less than this over the previous one is saturated.
+SATURATION_GAIN = 1.05
+
+
+class Sample(NamedTuple):
+    operation: str
+    seconds: float
+    status: Optional[int]  # None if the request failed without a response
+
+
+class OperationStats(NamedTuple):
+    operation: str
+    requests: int
+    errors: int
+    rejected: int  # 503s from a full server queue, also counted in `errors`
+    throughput: float
+    p50: float
+    p95: float
+    p99: float
+
+
+class LevelResult(NamedTuple):
+    concurrency: int
+    duration: float
+    throughput: float
+    error_rate: float
+    operations: list[OperationStats]
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def _summarize(concurrency: int, duration: float, samples: list[Sample]) -> LevelResult:
+    by_operation = defaultdict(list)
+    for sample in samples:
+        by_operation[sample.operation].append(sample)
+    operations = []
+    for operation, group in sorted(by_operation.items()):
+        latencies = sorted(s.seconds for s in group)
+        operations.append(OperationStats(
+            operation,
+            requests=len(group),
+            errors=sum(1 for s in group if s.status is None or s.status >= 400),
+            rejected=sum(1 for s in group if s.status == 503),
+            throughput=len(group) / duration,
+            p50=_percentile(latencies, 0.50),
+            p95=_percentile(latencies, 0.95),
+            p99=_percentile(latencies, 0.99),
+        ))
+    error_rate = sum(o.errors for o in operations) / len(samples) if samples else 0.0
+    return LevelResult(concurrency, duration, len(samples) / duration, error_rate, operations)
+
+
+class LoadTest:
+    def __init__(
+        self,
+        url: str,
+        links: list[str],
+        mix: dict[str, float],
+        timeout: float = 60.0,
+        new_link: Optional[Callable[[], str]] = None,
+    ):
+        self.url = url.rstrip("/")
+        self.links = links  # converted by `warm_up`, then by `reconvert`
+        self.new_link = new_link  # a link to a sheet not converted yet, for `convert`
+        self.operations, self.weights = zip(*mix.items())
+        self.timeout = timeout
+        self.downloads: list[str] = []
+
+    def warm_up(self, client: httpx.Client):
+        """Convert every link once, so there is something to download."""
+        for link in self.links:
+            r = client.post(f"{self.url}/api/convert", json={"link": link})
+            r.raise_for_status()
+            self.downloads.append(r.json()["file"])
+
+    def _request(self, client: httpx.Client, rng: random.Random) -> Sample:
+        operation = rng.choices(self.operations, self.weights)[0]
+        started = time.perf_counter()
+        try:
+            if operation == "convert":
+                r = client.post(f"{self.url}/api/convert", json={"link": self.new_link()})
+            elif operation == "reconvert":
+                r = client.post(f"{self.url}/api/convert", json={"link": rng.choice(self.links)})
+            else:
+                r = client.get(f"{self.url}{rng.choice(self.downloads)}")
+            status = r.status_code
+        except httpx.HTTPError:
+            status = None
+        return Sample(operation, time.perf_counter() - started, status)
+
+    def run_level(self, concurrency: int, duration: float) -> LevelResult:
+        samples: list[Sample] = []
+        samples_lock = threading.Lock()
+        deadline = time.perf_counter() + duration
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+        with httpx.Client(limits=limits, timeout=self.timeout) as client:
+            def worker(seed: int):
+                rng = random.Random(seed)
+                mine = []
+                while time.perf_counter() < deadline:
+                    mine.append(self._request(client, rng))
+                with samples_lock:
+                    samples.extend(mine)
+
+            started = time.perf_counter()
+            threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        return _summarize(concurrency, time.perf_counter() - started, samples)
+
+
+def _print_level(result: LevelResult):
+    print(
+        f"\nconcurrency {result.concurrency}: {result.throughput:,.1f} req/s, "
+        f"{result.error_rate:.2%} errors"
+    )
+    print(
+        f"  {'operation':<10} {'requests':>9} {'errors':>7} {'503s':>6} {'req/s':>9}"
+        f" {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+    )
+    for o in result.operations:
+        print(
+            f"  {o.operation:<10} {o.requests:>9,} {o.errors:>7,} {o.rejected:>6,} {o.throughput:>9,.1f}"
+            f" {o.p50 * 1e3:>9.1f} {o.p95 * 1e3:>9.1f} {o.p99 * 1e3:>9.1f}"
+        )
+
+
+def saturation_point(results: list[LevelResult], max_error_rate: float = 0.01) -> Optional[int]:
+    """The lowest concurrency beyond which adding clients no longer pays off, if reached."""
+    for previous, current in zip(results, results[1:]):
+        if current.error_rate > max_error_rate or current.throughput < previous.throughput * SATURATION_GAIN:
+            return previous.concurrency
+    return None
+
+
+def _wait_until_up(url: str, process: subprocess.Popen, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{' '.join(process.args)} exited with {process.returncode}")
+        try:
+            httpx.get(url, timeout=1.0)
+            return
+        except httpx.TransportError:
+            time.sleep(0.1)
+    raise TimeoutError(f"{url} did not come up within {timeout:.0f}s")
+
+
+@contextmanager
+def _subprocess(args: list[str], url: str, env: Optional[dict] = None) -> Iterator[subprocess.Popen]:
+    process = subprocess.Popen(
+        args, env={**os.environ, **(env or {})}, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        _wait_until_up(url, process)
+        yield process
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.loadtest", description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="the complendar web server")
+    parser.add_argument("--sheets-url", default="http://127.0.0.1:9000", help="the fake Google Sheets server")
+    parser.add_argument("--link", action="append", help="convert this link instead of generated ones; repeatable")
+    parser.add_argument("--sheets", type=int, default=10, help="distinct generated sheets to convert")
+    parser.add_argument("--rows", type=int, default=1000, help="rows per generated sheet")
+    parser.add_argument(
+        "--mix", default="convert=1,reconvert=1,download=4", help="relative weights of convert, reconvert and download"
+    )
+    parser.add_argument("--concurrency", default="1,2,4,8,16", help="comma-separated levels to ramp through")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per concurrency level")
+    parser.add_argument("--timeout", type=float, default=60.0, help="per-request timeout in seconds")
+    parser.add_argument("--serve", action="store_true", help="start the server and fake sheets as subprocesses")
+    parser.add_argument("--latency", type=float, help="with --serve, fake sheets seconds before the response headers")
+    parser.add_argument("--jitter", type=float, help="with --serve, up to this many extra seconds of latency")
+    parser.add_argument("--bandwidth", type=float, help="with --serve, fake sheets body bytes per second")
+    parser.add_argument("--no-etag", action="store_true", help="with --serve, fake sheets never answer 304")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    mix = {op: float(weight) for op, weight in (pair.split("=") for pair in args.mix.split(","))}
+    if not set(mix) <= {"convert", "reconvert", "download"}:
+        parser.error("--mix only supports convert, reconvert and download")
+    if args.link and "convert" in mix:
+        parser.error("convert needs generated sheets; use reconvert with --link")
+    fake_sheets_args = [
+        *(["--latency", str(args.latency)] if args.latency is not None else []),
+        *(["--jitter", str(args.jitter)] if args.jitter is not None else []),
+        *(["--bandwidth", str(args.bandwidth)] if args.bandwidth is not None else []),
+        *(["--no-etag"] if args.no_etag else []),
+    ]
+    if fake_sheets_args and not args.serve:
+        parser.error("--latency, --jitter, --bandwidth and --no-etag need --serve")
+    links = args.link or [sheet_link(args.sheets_url, args.rows, seed) for seed in range(args.sheets)]
+    # Seeds after the warmed-up ones; next() on a count is atomic, so workers can share it.
+    new_seeds = itertools.count(args.sheets)
+    levels = [int(n) for n in args.concurrency.split(",")]
+
+    with ExitStack() as stack:
+        if args.serve:
+            sheets_port = urllib.parse.urlsplit(args.sheets_url).port or 80
+            stack.enter_context(_subprocess(
+                [sys.executable, "-m", "benchmarks.fake_sheets", "--port", str(sheets_port), *fake_sheets_args],
+                args.sheets_url,
+            ))
+            stack.enter_context(_subprocess(
+                [sys.executable, "-m", "complendar"],
+                args.url,
+                env={
+                    "COMPLENDAR_SHEETS_BASE_URL": args.sheets_url,
+                    "COMPLENDAR_PORT": str(urllib.parse.urlsplit(args.url).port or 80),
+                },
+            ))
+        test = LoadTest(
+            args.url, links, mix, args.timeout, new_link=lambda: sheet_link(args.sheets_url, args.rows, next(new_seeds))
+        )
+        with httpx.Client(timeout=args.timeout) as client:
+            test.warm_up(client)
+        print(f"{len(links)} sheets warmed up, mix {args.mix}, {args.duration:g}s per level")
+        results = []
+        for concurrency in levels:
+            results.append(test.run_level(concurrency, args.duration))
+            _print_level(results[-1])
+
+    saturated = saturation_point(results)
+    if len(results) > 1:
+        if saturated is None:
+            print(f"\nNot saturated: throughput still grew at concurrency {levels[-1]}.")
+        else:
+            print(f"\nSaturated at concurrency {saturated}: more clients added latency or errors, not throughput.")
+    if args.output:
+        report = {
+            "url": args.url,
+            "mix": mix,
+            "links": len(links),
+            "saturation_point": saturated,
+            "levels": [{**r._asdict(), "operations": [o._asdict() for o in r.operations]} for r in results],
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
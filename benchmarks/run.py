@@ -0,0 +1,183 @@
+"""Pipeline benchmarks on synthetic Google-Form sheets.
+
+Each stage is timed on its own, and so is the whole in-process path from CSV bytes to
+ICS text, with the serializer the server would use by default. The report gives rows/s
+(calls/s for header guessing, which only looks at the header row) and peak Python
+memory (tracemalloc), and can be written as JSON and compared with a run from another
+commit:
+
+    python -m benchmarks.run --rows 10,1000,100000 --output before.json
+    python -m benchmarks.run --rows 10,1000,100000 --compare before.json
+
+Memory is measured in a separate, untimed run, since tracing slows everything down.
+Allocations made by the render pool's worker processes are not counted.
+"""
+import argparse
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+from csv import DictReader
+from typing import Callable, Iterator, NamedTuple, Optional
+
+import complendar
+from benchmarks.generate import HEADER_STYLES, generate_csv
+
+# ical takes minutes on the largest sheets, so by default it only runs on small ones.
+ICAL_MAX_ROWS = 10_000
+CHUNK_SIZE = 64 * 1024  # roughly what httpx yields from a streamed response
+# Stages whose cost does not depend on the number of rows, reported per call.
+PER_CALL_STAGES = {"guess_headers"}
+
+
+class Result(NamedTuple):
+    stage: str
+    rows: int
+    seconds: float
+    per_second: float  # rows, or calls for PER_CALL_STAGES
+    unit: str
+    peak_bytes: int
+
+
+def _chunks(data: bytes) -> Iterator[bytes]:
+    return (data[i:i + CHUNK_SIZE] for i in range(0, len(data), CHUNK_SIZE))
+
+
+def _clear_caches():
+    complendar._parse_birthday.cache_clear()
+    complendar.Entry._ics_body.cache_clear()
+
+
+def _stages(data: bytes) -> dict[str, Callable[[], object]]:
+    """Every benchmark as a zero-argument callable, with its inputs prepared up front."""
+    lines = list(complendar._iter_lines([data]))
+    rows, _ = complendar._format_csv(lines)
+    entries = list(rows)
+
+    def parse():
+        rows, _ = complendar._format_csv(lines)
+        return list(rows)
+
+    def end_to_end():
+        # No serializer is forced, so this follows COMPLENDAR_NATIVE_ICS like the server.
+        rows, _ = complendar._format_csv(complendar._iter_lines(_chunks(data)))
+        return complendar._convert_entries_to_ics(list(rows))
+
+    return {
+        "decode": lambda: list(complendar._iter_lines(_chunks(data))),
+        "guess_headers": lambda: complendar._guess_headers_from_reader_fieldnames(DictReader(lines[:1])),
+        "parse": parse,
+        "render_native": lambda: complendar._convert_entries_to_ics(entries, native=True, parallel=False),
+        "render_native_parallel": lambda: complendar._convert_entries_to_ics(entries, native=True),
+        "render_ical": lambda: complendar._convert_entries_to_ics(entries, native=False),
+        "end_to_end": end_to_end,
+    }
+
+
+STAGES = list(_stages(generate_csv(1)))
+
+
+def _peak_bytes(run: Callable[[], object]) -> int:
+    _clear_caches()
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _bench(stage: str, rows: int, run: Callable[[], object], repeat: int) -> Result:
+    best = float("inf")
+    for _ in range(repeat):
+        _clear_caches()
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    count, unit = (1, "calls") if stage in PER_CALL_STAGES else (rows, "rows")
+    return Result(stage, rows, best, count / best if best else 0.0, unit, _peak_bytes(run))
+
+
+def run(
+    sizes: list[int],
+    stages: Optional[list[str]] = None,
+    repeat: int = 3,
+    **options,
+) -> list[Result]:
+    results = []
+    for rows in sizes:
+        benchmarks = _stages(generate_csv(rows, **options))
+        for stage in stages or STAGES:
+            if stage == "render_ical" and stages is None and rows > ICAL_MAX_ROWS:
+                continue
+            result = _bench(stage, rows, benchmarks[stage], repeat)
+            print(
+                f"{rows:>9,} rows  {stage:<23} {result.seconds * 1e3:10.2f} ms"
+                f"  {result.per_second:14,.0f} {result.unit}/s  {result.peak_bytes / 2**20:9.1f} MiB peak"
+            )
+            results.append(result)
+    return results
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _compare(results: list[Result], baseline_path: str):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["stage"], r["rows"]): r for r in json.load(f)["results"]}
+    print(f"\nCompared with {baseline_path} (>1.00x is faster now)")
+    for result in results:
+        before = baseline.get((result.stage, result.rows))
+        if before:
+            speedup = before["seconds"] / result.seconds
+            memory = result.peak_bytes / before["peak_bytes"] if before["peak_bytes"] else 0.0
+            print(f"{result.rows:>9,} rows  {result.stage:<23} {speedup:6.2f}x time  {memory:6.2f}x memory")
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", default="10,1000,100000", help="comma-separated sheet sizes, up to 1000000")
+    parser.add_argument("--stages", help=f"comma-separated subset of: {', '.join(STAGES)}")
+    parser.add_argument("--headers", choices=list(HEADER_STYLES), default="form", help="header naming style")
+    parser.add_argument("--invalid-ratio", type=float, default=0.05, help="share of rows with a bad birthday")
+    parser.add_argument("--unicode-ratio", type=float, default=0.2, help="share of rows with a non-ASCII name")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per benchmark; the best is kept")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="print speedups against a JSON file from an earlier run")
+    args = parser.parse_args(argv)
+
+    options = dict(
+        header_style=args.headers, invalid_ratio=args.invalid_ratio, unicode_ratio=args.unicode_ratio, seed=args.seed
+    )
+    stages = args.stages.split(",") if args.stages else None
+    if stages and not set(stages) <= set(STAGES):
+        parser.error(f"unknown stages: {', '.join(sorted(set(stages) - set(STAGES)))}")
+    results = run([int(n) for n in args.rows.split(",")], stages, args.repeat, **options)
+
+    if args.output:
+        report = {
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "options": options,
+            "native_ics": complendar.NATIVE_ICS,
+            "results": [r._asdict() for r in results],
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved {len(results)} results to {args.output}")
+    if args.compare:
+        _compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,48 +1,323 @@
 #!/usr/bin/env python3
+from __future__ import annotations
+
+import atexit
 import functools
 import http.server
 import json
-import socketserver
+import os
 import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from codecs import getincrementaldecoder
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, field
 import urllib.parse
 from csv import DictReader
-from datetime import date, datetime, timedelta
-from hashlib import sha3_256
-from io import BytesIO, TextIOWrapper
+from datetime import date, datetime, timedelta, timezone
+from hashlib import sha256, sha3_256
+from io import BytesIO, IncrementalNewlineDecoder
 from pathlib import Path
-from re import compile as com
-from tempfile import gettempdir
-from typing import Iterable, NamedTuple, Optional, Tuple, Union
+from re import compile as com, escape
+from textwrap import TextWrapper
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Hashable, Iterable, Iterator, NamedTuple, Optional, Tuple, Union
 from uuid import UUID, uuid4
 
-import httpx
-from ical.alarm import Action, Alarm
-from ical.calendar import Calendar
-from ical.calendar_stream import IcsCalendarStream
-from ical.event import Event
-from ical.recurrence import Recur
-from ical.types import Frequency
+# httpx, ical (which pulls in pydantic) and multiprocessing are imported where they
+# are used, so the CLI and server start without paying for them; see
+# benchmarks/bench_startup.py.
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+    import httpx
+    from ical.event import Event
 
 # ---------------- CONFIG ----------------
+# Where sheets are exported from; point it at `benchmarks.fake_sheets` to run offline.
+SHEETS_BASE_URL = os.environ.get("COMPLENDAR_SHEETS_BASE_URL", "https://docs.google.com").rstrip("/")
 SPREADSHEET_LINK = com(
-    r"^https://docs\.google\.com/spreadsheets/d/(?P<spreadsheet_id>[^/]{44})/(.*)?(\?(?P<query_params>.*))?"
+    rf"^{escape(SHEETS_BASE_URL)}/spreadsheets/d/(?P<spreadsheet_id>[^/]{{44}})/(.*)?(\?(?P<query_params>.*))?"
 )
+SHEET_GID = com(r"[#?&]gid=(?P<gid>\d+)")
 STATIC_DIR = Path(__file__).parent / "static"
-STATIC_DIR.mkdir(exist_ok=True)
+
+# Shared HTTP client pool (overridable through the environment).
+HTTP_MAX_CONNECTIONS = int(os.environ.get("COMPLENDAR_HTTP_MAX_CONNECTIONS", 20))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get("COMPLENDAR_HTTP_MAX_KEEPALIVE", 10))
+HTTP_KEEPALIVE_EXPIRY = float(os.environ.get("COMPLENDAR_HTTP_KEEPALIVE_EXPIRY", 30.0))
+HTTP_TIMEOUT = float(os.environ.get("COMPLENDAR_HTTP_TIMEOUT", 30.0))
+
+# Number of sheets whose ETag / Last-Modified validators are remembered.
+SHEET_CACHE_SIZE = int(os.environ.get("COMPLENDAR_SHEET_CACHE_SIZE", 128))
+
+# Number of distinct birthday strings whose parsed date is memoized.
+BIRTHDAY_CACHE_SIZE = int(os.environ.get("COMPLENDAR_BIRTHDAY_CACHE_SIZE", 4096))
+
+# Web server port, and its concurrency: worker threads, and requests allowed to wait for one.
+PORT = int(os.environ.get("COMPLENDAR_PORT", 8000))
+SERVER_WORKERS = int(os.environ.get("COMPLENDAR_SERVER_WORKERS", 8))
+SERVER_QUEUE_DEPTH = int(os.environ.get("COMPLENDAR_SERVER_QUEUE_DEPTH", 32))
+
+# Converted calendars remembered by the digest of their CSV, and the memory they may take.
+CONVERSION_CACHE_SIZE = int(os.environ.get("COMPLENDAR_CONVERSION_CACHE_SIZE", 64))
+CONVERSION_CACHE_MAX_BYTES = int(os.environ.get("COMPLENDAR_CONVERSION_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+
+# Generated calendars kept for /download/: an in-memory LRU, plus an optional disk
+# tier when COMPLENDAR_ARTIFACT_DIR is set.
+ARTIFACT_MAX_BYTES = int(os.environ.get("COMPLENDAR_ARTIFACT_MAX_BYTES", 64 * 1024 * 1024))
+ARTIFACT_TTL = float(os.environ.get("COMPLENDAR_ARTIFACT_TTL", 60 * 60))
+ARTIFACT_DIR = os.environ.get("COMPLENDAR_ARTIFACT_DIR")
+ARTIFACT_DISK_MAX_BYTES = int(os.environ.get("COMPLENDAR_ARTIFACT_DISK_MAX_BYTES", 512 * 1024 * 1024))
+
+# Background conversions started through POST /api/jobs.
+JOB_WORKERS = int(os.environ.get("COMPLENDAR_JOB_WORKERS", 4))
+JOB_QUEUE_DEPTH = int(os.environ.get("COMPLENDAR_JOB_QUEUE_DEPTH", 64))
+
+# Batch CLI mode: sheets fetched at once, and processes rendering calendars
+# (defaults to one per CPU).
+BATCH_CONNECTIONS = int(os.environ.get("COMPLENDAR_BATCH_CONNECTIONS", 8))
+BATCH_PROCESSES = int(os.environ.get("COMPLENDAR_BATCH_PROCESSES", 0)) or None
+
+# Minimum seconds between "bytes received" events on /api/convert/events.
+SSE_BYTES_INTERVAL = float(os.environ.get("COMPLENDAR_SSE_BYTES_INTERVAL", 0.25))
+
+# Serialize calendars with the built-in writer rather than the ical object model (its
+# output is identical), and how many rendered rows (VEVENT blocks) it keeps for later
+# conversions.
+NATIVE_ICS = os.environ.get("COMPLENDAR_NATIVE_ICS", "1").lower() in ("1", "true", "yes")
+VEVENT_CACHE_SIZE = int(os.environ.get("COMPLENDAR_VEVENT_CACHE_SIZE", 10_000))
+
+# Calendars with at least this many events are rendered in chunks on a process pool,
+# by the built-in serializer even if NATIVE_ICS is off.
+PARALLEL_RENDER_MIN_ROWS = int(os.environ.get("COMPLENDAR_PARALLEL_RENDER_MIN_ROWS", 20_000))
+RENDER_CHUNK_SIZE = int(os.environ.get("COMPLENDAR_RENDER_CHUNK_SIZE", 5_000))
+RENDER_PROCESSES = int(os.environ.get("COMPLENDAR_RENDER_PROCESSES", 0)) or None
+
+# Seconds a /calendar/ subscription is served from memory before the sheet is checked again,
+# and the memory those calendars may take.
+CALENDAR_TTL = float(os.environ.get("COMPLENDAR_CALENDAR_TTL", 5 * 60))
+CALENDAR_MAX_BYTES = int(os.environ.get("COMPLENDAR_CALENDAR_MAX_BYTES", 32 * 1024 * 1024))
+
+
+# ---------------- METRICS ----------------
+def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in labels
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+class Counter:
+    def __init__(self, name: str, help: str):
+        self.name, self.help = name, help
+        self._values: dict[Tuple[Tuple[str, str], ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: str):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            lines += [f"{self.name}{_format_labels(k)} {v}" for k, v in self._values.items()]
+        return lines
+
+
+class Histogram:
+    BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+    def __init__(self, name: str, help: str, buckets: Tuple[float, ...] = BUCKETS):
+        self.name, self.help, self.buckets = name, help, buckets
+        # labels → (per-bucket counts, sum, count)
+        self._values: dict[Tuple[Tuple[str, str], ...], Tuple[list[int], float, int]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            counts, total, count = self._values.get(key) or ([0] * len(self.buckets), 0.0, 0)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            self._values[key] = (counts, total + value, count + 1)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, (counts, total, count) in self._values.items():
+                for bound, bucket_count in zip(self.buckets, counts):
+                    lines.append(f"{self.name}_bucket{_format_labels(key + (('le', str(bound)),))} {bucket_count}")
+                lines.append(f"{self.name}_bucket{_format_labels(key + (('le', '+Inf'),))} {count}")
+                lines.append(f"{self.name}_sum{_format_labels(key)} {total}")
+                lines.append(f"{self.name}_count{_format_labels(key)} {count}")
+        return lines
+
+
+class _CallbackMetric(NamedTuple):
+    name: str
+    type: str
+    help: str
+    read: Callable[[], float]
+
+    def render(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}", f"{self.name} {self.read()}"]
+
+
+class MetricsRegistry:
+    """The metrics served on /metrics, in the Prometheus text format."""
+
+    def __init__(self):
+        self._metrics = []
+
+    def counter(self, name: str, help: str) -> Counter:
+        self._metrics.append(metric := Counter(name, help))
+        return metric
+
+    def histogram(self, name: str, help: str) -> Histogram:
+        self._metrics.append(metric := Histogram(name, help))
+        return metric
+
+    def callback(self, name: str, type: str, help: str, read: Callable[[], float]):
+        """Report a value kept elsewhere (e.g. a cache's own counters) at scrape time."""
+        self._metrics.append(_CallbackMetric(name, type, help, read))
+
+    def render(self) -> str:
+        return "".join(f"{line}\n" for metric in self._metrics for line in metric.render())
+
+
+METRICS = MetricsRegistry()
+STAGE_SECONDS = METRICS.histogram(
+    "complendar_stage_seconds", "Time spent in each conversion stage (fetch, parse, guess_headers, ...)."
+)
+ROWS_PARSED = METRICS.counter("complendar_rows_parsed_total", "CSV rows parsed.")
+ROWS_REJECTED = METRICS.counter("complendar_rows_rejected_total", "CSV rows without a name or a valid birthday.")
+SHEETS_NOT_MODIFIED = METRICS.counter(
+    "complendar_sheets_not_modified_total", "Sheet fetches answered with 304 Not Modified."
+)
+SHEET_BYTES_WIRE = METRICS.counter(
+    "complendar_sheet_bytes_wire_total", "Sheet bytes received from Google as sent, i.e. compressed."
+)
+SHEET_BYTES_DECODED = METRICS.counter("complendar_sheet_bytes_decoded_total", "Sheet CSV bytes after decompression.")
+RENDER_POOL_FAILURES = METRICS.counter(
+    "complendar_render_pool_failures_total", "Render pools replaced after a worker died, e.g. OOM-killed."
+)
+
+
+class _Stopwatch:
+    """Accumulates the wall time spent inside its `with` blocks."""
+
+    def __init__(self):
+        self.seconds = 0.0
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.seconds += time.perf_counter() - self._started
+
+
+@contextmanager
+def _timed(stage: str):
+    """Record the duration of a block (or, as a decorator, a call) under `stage`."""
+    with _Stopwatch() as stopwatch:
+        yield
+    STAGE_SECONDS.observe(stopwatch.seconds, stage=stage)
+
+
+# ---------------- SINGLE FLIGHT ----------------
+class _SingleFlight:
+    """Runs one call per key at a time; callers arriving meanwhile wait for it and share its outcome."""
+
+    def __init__(self):
+        self._calls: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.calls = 0  # calls that ran `fn`
+        self.shared = 0  # calls that waited for another one instead
+
+    def do(
+        self, key: Hashable, fn: Callable[[], Any], on_shared: Optional[Callable[[], None]] = None
+    ) -> Tuple[Any, bool]:
+        """Return `fn()`, or the result of the call already running for `key`, and whether it was shared.
+
+        `on_shared` is called before waiting for a call that is already running.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            shared = future is not None
+            if shared:
+                self.shared += 1
+            else:
+                self.calls += 1
+                future = self._calls[key] = Future()
+        if shared:
+            if on_shared is not None:
+                on_shared()
+            return future.result(), True
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._calls[key]
+        return future.result(), False
 
 
 # ---------------- DATA MODEL ----------------
+_ICS_ESCAPES = str.maketrans({"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n"})
+_ICS_CONTROL_CHARS = com("[\x00-\x08\x0a-\x1f\x7f]")
+_ICS_FOLD = TextWrapper(
+    width=75,
+    subsequent_indent=" ",
+    drop_whitespace=False,
+    replace_whitespace=False,
+    expand_tabs=False,
+    break_on_hyphens=False,
+)
+
+
+def _ics_text(value: str) -> str:
+    return _ICS_CONTROL_CHARS.sub("", value.translate(_ICS_ESCAPES))
+
+
+def _ics_lines(*contentlines: str) -> str:
+    # Folds exactly like the ical package (75 characters, preferring whitespace)
+    # so both serializers produce byte-identical calendars.
+    return "\n".join(
+        line if len(line) <= _ICS_FOLD.width else "\n".join(_ICS_FOLD.wrap(line))
+        for line in contentlines
+    )
+
+
 class Entry(NamedTuple):
     name: str
     date: date
 
-    def to_event(self) -> Event:
-        possessive = "'" if self.name.endswith("s") else "'s"
+    @property
+    def uid(self) -> str:
         event_hash = sha3_256(
             f"{self.name} {self.date.isoformat()}".encode()
         ).hexdigest()[:32]
+        return f"{UUID(event_hash)}@complendar.event"
+
+    def to_event(self) -> Event:
+        from ical.alarm import Action, Alarm
+        from ical.event import Event
+        from ical.recurrence import Recur
+        from ical.types import Frequency
+
+        possessive = "'" if self.name.endswith("s") else "'s"
         return Event(
-            uid=f"{UUID(event_hash)}@complendar.event",
+            uid=self.uid,
             summary=f"{self.name}{possessive} Birthday",
             description=f"Celebrate {self.name}'s birthday 🎂",
             categories=["BIRTHDAY"],
@@ -63,20 +338,334 @@ class Entry(NamedTuple):
             ],
         )
 
+    def to_ics(self, dtstamp: str) -> str:
+        """Serialize the same VEVENT as `to_event` directly, without the ical object model."""
+        return f"BEGIN:VEVENT\nDTSTAMP:{dtstamp}\n{self._ics_body()}"
 
-# ---------------- CORE LOGIC ----------------
-def _get_csv_from_sheets(spreadsheet_link: str) -> BytesIO:
+    @functools.lru_cache(maxsize=VEVENT_CACHE_SIZE)
+    def _ics_body(self) -> str:
+        # Everything after DTSTAMP, the only line that differs between conversions,
+        # so rendered rows are shared by every conversion in the process.
+        possessive = "'" if self.name.endswith("s") else "'s"
+        name = _ics_text(self.name)
+        return _ics_lines(
+            f"UID:{self.uid}",
+            f"DTSTART;VALUE=DATE:{self.date.strftime('%Y%m%d')}",
+            f"SUMMARY:{name}{possessive} Birthday",
+            "CATEGORIES:BIRTHDAY",
+            f"DESCRIPTION:Celebrate {name}'s birthday 🎂",
+            "RRULE:FREQ=YEARLY",
+            "TRANSP:TRANSPARENT",
+            "BEGIN:VALARM",
+            "ACTION:DISPLAY",
+            "TRIGGER:-P1D",
+            f"DESCRIPTION:Tomorrow is {name}{possessive} birthday!",
+            "END:VALARM",
+            "BEGIN:VALARM",
+            "ACTION:DISPLAY",
+            "TRIGGER:P",
+            f"DESCRIPTION:Today is {name}{possessive} birthday! 🎉",
+            "END:VALARM",
+            "END:VEVENT",
+        )
+
+
+# ---------------- HTTP CLIENTS ----------------
+# Sheets are fetched from worker threads only, so there is one synchronous client and no
+# async counterpart that would need its own event loop to be closed.
+_http_client_lock = threading.Lock()
+_http_client: Optional[httpx.Client] = None
+
+
+@functools.cache
+def _brotli():
+    """The brotli module, or its CFFI port, if either is installed; None otherwise."""
+    try:
+        import brotli
+    except ImportError:
+        try:
+            import brotlicffi as brotli
+        except ImportError:
+            return None
+    return brotli
+
+
+def _http_client_options() -> dict:
+    import httpx
+
+    return dict(
+        # httpx decodes either one as the body streams in; br only if `_brotli` finds a module.
+        headers={"Accept-Encoding": "br, gzip" if _brotli() is not None else "gzip"},
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(HTTP_TIMEOUT),
+        follow_redirects=True,
+    )
+
+
+def _get_http_client() -> httpx.Client:
+    """Return the process-wide pooled client, creating it on first use."""
+    import httpx
+
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None or _http_client.is_closed:
+            _http_client = httpx.Client(**_http_client_options())
+        return _http_client
+
+
+@atexit.register
+def _close_http_client():
+    with _http_client_lock:
+        if _http_client is not None:
+            _http_client.close()
+
+
+# ---------------- CONVERSION CACHE ----------------
+class Conversion(NamedTuple):
+    ics: str
+    headers: Tuple[str, str]
+    digest: str  # sha256 of the CSV bytes the calendar was generated from
+
+
+class ConversionCache:
+    """LRU of converted calendars keyed by the digest of their source CSV.
+
+    Bounded both by entry count and by the total length of the calendars; the newest
+    calendar is always kept, even if it alone exceeds `max_bytes`.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._items: "OrderedDict[str, Conversion]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, digest: str) -> Optional[Conversion]:
+        with self._lock:
+            conversion = self._items.get(digest)
+            if conversion is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._items.move_to_end(digest)
+            return conversion
+
+    def peek(self, digest: str) -> Optional[Conversion]:
+        """Like `get`, but not counted as a hit or a miss."""
+        with self._lock:
+            conversion = self._items.get(digest)
+            if conversion is not None:
+                self._items.move_to_end(digest)
+            return conversion
+
+    def put(self, conversion: Conversion):
+        with self._lock:
+            self._discard(conversion.digest)
+            self._items[conversion.digest] = conversion
+            self._size += len(conversion.ics)
+            while len(self._items) > 1 and (len(self._items) > self.max_entries or self._size > self.max_bytes):
+                self._discard(next(iter(self._items)))
+
+    def _discard(self, digest: str):
+        conversion = self._items.pop(digest, None)
+        if conversion is not None:
+            self._size -= len(conversion.ics)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._items), "bytes": self._size}
+
+
+_conversion_cache = ConversionCache(CONVERSION_CACHE_SIZE, CONVERSION_CACHE_MAX_BYTES)
+METRICS.callback(
+    "complendar_conversion_cache_hits_total", "counter", "Conversions served from the CSV digest cache.",
+    lambda: _conversion_cache.hits,
+)
+METRICS.callback(
+    "complendar_conversion_cache_misses_total", "counter", "Conversions that had to be rendered.",
+    lambda: _conversion_cache.misses,
+)
+
+
+# ---------------- SHEET CACHE ----------------
+class _CachedSheet(NamedTuple):
+    etag: Optional[str]
+    last_modified: Optional[str]
+    conversion: Conversion
+
+
+class SheetFetch(NamedTuple):
+    key: Tuple[str, str]
+    lines: Iterable[str]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    cached: Optional[_CachedSheet] = None  # set when Google answered 304 Not Modified
+    digest: Optional[Any] = None  # fed with the CSV bytes as `lines` is consumed
+
+    @property
+    def not_modified(self) -> bool:
+        return self.cached is not None
+
+
+# Validators and the CSV digest only: the calendar itself stays in `_conversion_cache`,
+# so that its byte budget covers it.
+_sheet_cache: "OrderedDict[Tuple[str, str], Tuple[Optional[str], Optional[str], str]]" = OrderedDict()
+_sheet_cache_lock = threading.Lock()
+
+
+def _sheet_key(spreadsheet_link: str) -> Tuple[str, str]:
     m = SPREADSHEET_LINK.match(spreadsheet_link)
     if not m:
         raise ValueError("Invalid spreadsheet link")
+    gid = SHEET_GID.search(spreadsheet_link)
+    return m["spreadsheet_id"], gid["gid"] if gid else "0"
+
+
+def _cached_sheet(key: Tuple[str, str]) -> Optional[_CachedSheet]:
+    with _sheet_cache_lock:
+        item = _sheet_cache.get(key)
+    if item is None:
+        return None
+    etag, last_modified, digest = item
+    conversion = _conversion_cache.peek(digest)
+    if conversion is None:
+        # The calendar was evicted, so a 304 would leave nothing to serve.
+        with _sheet_cache_lock:
+            if _sheet_cache.get(key) == item:
+                del _sheet_cache[key]
+        return None
+    return _CachedSheet(etag, last_modified, conversion)
+
+
+def _conditional_headers(cached: Optional[_CachedSheet]) -> dict:
+    headers = {}
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+    return headers
+
+
+def _store_sheet(key: Tuple[str, str], cached: _CachedSheet):
+    with _sheet_cache_lock:
+        _sheet_cache[key] = (cached.etag, cached.last_modified, cached.conversion.digest)
+        _sheet_cache.move_to_end(key)
+        while len(_sheet_cache) > SHEET_CACHE_SIZE:
+            _sheet_cache.popitem(last=False)
+
+
+def _remember_conversion(fetched: SheetFetch, conversion: Conversion):
+    """Keep a conversion result together with the validators it was produced from."""
+    if fetched.etag or fetched.last_modified:
+        _store_sheet(fetched.key, _CachedSheet(fetched.etag, fetched.last_modified, conversion))
+
+
+# ---------------- CORE LOGIC ----------------
+class _LineDecoder:
+    """Incrementally decodes byte chunks into newline-terminated text lines.
+
+    Newlines are translated the same way `TextIOWrapper` does by default, so
+    `DictReader` sees exactly what it would when reading a whole file.
+    """
+
+    def __init__(self, encoding: str = "utf-8"):
+        self._decoder = IncrementalNewlineDecoder(getincrementaldecoder(encoding)(), translate=True)
+        self._pending = ""
+
+    def feed(self, chunk: bytes, final: bool = False) -> list[str]:
+        *lines, self._pending = (self._pending + self._decoder.decode(chunk, final=final)).split("\n")
+        lines = [f"{line}\n" for line in lines]
+        if final and self._pending:
+            lines.append(self._pending)
+            self._pending = ""
+        return lines
+
 
-    spreadsheet_id = m["spreadsheet_id"]
-    query_params = f"?{m['query_params']}" if m["query_params"] else ""
+def _waited(chunks: Iterable[bytes], stopwatch: _Stopwatch) -> Iterator[bytes]:
+    """Yield `chunks`, timing how long each one takes to arrive."""
+    chunks = iter(chunks)
+    while True:
+        with stopwatch:
+            chunk = next(chunks, None)
+        if chunk is None:
+            return
+        yield chunk
 
-    csv_url: str = f"https://docs.google.com/spreadsheets/d/{m['spreadsheet_id']}/export?format=csv{query_params}"
-    r: httpx.Response = httpx.get(url=csv_url, follow_redirects=True)
-    r.raise_for_status()
-    return BytesIO(r.read())
+
+def _digested(
+    chunks: Iterable[bytes], digest: Any, on_bytes: Optional[Callable[[int], None]] = None
+) -> Iterator[bytes]:
+    received = 0
+    for chunk in chunks:
+        digest.update(chunk)
+        received += len(chunk)
+        if on_bytes is not None:
+            on_bytes(received)
+        yield chunk
+
+
+def _counted(chunks: Iterable[bytes], counter: Counter) -> Iterator[bytes]:
+    for chunk in chunks:
+        counter.inc(len(chunk))
+        yield chunk
+
+
+def _iter_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    decoder = _LineDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.feed(b"", final=True)
+
+
+def _csv_export_url(spreadsheet_link: str) -> str:
+    # The gid picks the tab; it is the same one the sheet caches and coalescing key on.
+    spreadsheet_id, gid = _sheet_key(spreadsheet_link)
+    return f"{SHEETS_BASE_URL}/spreadsheets/d/{spreadsheet_id}/export?format=csv&gid={gid}"
+
+
+@contextmanager
+def _get_csv_from_sheets(
+    spreadsheet_link: str, on_bytes: Optional[Callable[[int], None]] = None
+) -> Iterator[SheetFetch]:
+    """Stream the CSV export of a sheet; the lines are only valid inside the `with` block.
+
+    `on_bytes` is called with the running total of bytes received after every chunk.
+    """
+    csv_url = _csv_export_url(spreadsheet_link)
+    key = _sheet_key(spreadsheet_link)
+    cached = _cached_sheet(key)
+    # Fetch time is the wait for the response headers plus the time spent waiting for
+    # body chunks, which excludes the parsing that happens in between.
+    network = _Stopwatch()
+    try:
+        with network:
+            client = _get_http_client()
+            r = client.send(client.build_request("GET", csv_url, headers=_conditional_headers(cached)), stream=True)
+        with closing(r):
+            try:
+                if r.status_code == 304 and cached is not None:
+                    SHEETS_NOT_MODIFIED.inc()
+                    _store_sheet(key, cached)
+                    yield SheetFetch(key, (), cached=cached)
+                    return
+                r.raise_for_status()
+                digest = sha256()
+                # The body is decompressed chunk by chunk as it arrives, never as a whole.
+                chunks = _counted(_waited(r.iter_bytes(), network), SHEET_BYTES_DECODED)
+                lines = _iter_lines(_digested(chunks, digest, on_bytes))
+                yield SheetFetch(key, lines, r.headers.get("ETag"), r.headers.get("Last-Modified"), digest=digest)
+            finally:
+                SHEET_BYTES_WIRE.inc(r.num_bytes_downloaded)
+    finally:
+        STAGE_SECONDS.observe(network.seconds, stage="fetch")
 
 
 def _jaccard_similarity(a: str, b: str) -> float:
@@ -85,6 +674,7 @@ def _jaccard_similarity(a: str, b: str) -> float:
     return len(s_a.intersection(s_b)) / len(s_a.union(s_b))
 
 
+@_timed("guess_headers")
 def _guess_headers_from_reader_fieldnames(reader: DictReader) -> Tuple[str, str]:
     fieldnames = list(reader.fieldnames)  # noqa
 
@@ -96,108 +686,1152 @@ def _guess_headers_from_reader_fieldnames(reader: DictReader) -> Tuple[str, str]
     return _most_similar_header("your name"), _most_similar_header("your birthday")
 
 
+_NON_ZERO_DIGITS = frozenset("123456789")
+
+
+@functools.lru_cache(maxsize=BIRTHDAY_CACHE_SIZE)
+def _parse_birthday(birthday: Optional[str]) -> Optional[date]:
+    """Parse `M/D/YYYY` without `strptime`.
+
+    Accepts and rejects exactly what `datetime.strptime(birthday, "%m/%d/%Y")` does,
+    including its quirks (a space-padded day, non-ASCII digits in the year), and
+    returns None instead of raising.
+    """
+    if not isinstance(birthday, str):
+        return None
+    parts = birthday.split("/")
+    if len(parts) != 3:
+        return None
+    month, day, year = parts
+
+    if len(month) == 1:
+        valid_month = month in _NON_ZERO_DIGITS
+    elif len(month) == 2:
+        valid_month = (month[0] == "0" and month[1] in _NON_ZERO_DIGITS) or month in ("10", "11", "12")
+    else:
+        valid_month = False
+
+    if len(day) == 1:
+        valid_day = day in _NON_ZERO_DIGITS
+    elif len(day) == 2:
+        valid_day = (
+            (day[0] in "0 " and day[1] in _NON_ZERO_DIGITS)
+            or (day[0] in "12" and day[1].isdecimal())
+            or day in ("30", "31")
+        )
+    else:
+        valid_day = False
+
+    if not (valid_month and valid_day and len(year) == 4 and year.isdecimal()):
+        return None
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
 def _parse_row(row, name_header: str, birthday_header: str) -> Optional[Entry]:
     name = row.get(name_header, None)
-    birthday = row.get(birthday_header, None)
-    try:
-        birthday_dt: Optional[datetime] = datetime.strptime(birthday, "%m/%d/%Y")
-    except (ValueError, TypeError):
+    birthday_date = _parse_birthday(row.get(birthday_header, None))
+    if birthday_date is None:
         return None
-    return Entry(name=name, date=birthday_dt.date()) if name else None
+    return Entry(name=name, date=birthday_date) if name else None
+
+
+def _format_csv(csv_lines: Iterable[str]) -> tuple[Iterable[Optional[Entry]], Tuple[str, str]]:
+    reader = DictReader(csv_lines)
+    if not reader.fieldnames:
+        raise ValueError("Empty CSV. There is no data to parse.")
+    name_header, birthday_header = _guess_headers_from_reader_fieldnames(reader)
+    rows = _parse_rows(reader, name_header, birthday_header)
+    return rows, (name_header, birthday_header)
 
 
-def _format_csv(csv_bytes: BytesIO) -> tuple[Iterable[Optional[Entry]], Tuple[str, str]]:
-    with TextIOWrapper(csv_bytes) as f:
-        reader = DictReader(f.readlines())
-        if not reader.fieldnames:
-            raise ValueError("Empty CSV. There is no data to parse.")
-        name_header, birthday_header = _guess_headers_from_reader_fieldnames(reader)
-        rows = map(lambda x: _parse_row(x, name_header, birthday_header), reader)
-        return rows, (name_header, birthday_header)
+def _parse_rows(reader: DictReader, name_header: str, birthday_header: str) -> Iterator[Optional[Entry]]:
+    # Parse time is this thread's CPU time between yields: it covers decoding and CSV
+    # parsing but neither the consumer of the rows nor waiting for the download.
+    parsed = rejected = 0
+    cpu_seconds = 0.0
+    try:
+        resumed = time.thread_time()
+        for row in reader:
+            entry = _parse_row(row, name_header, birthday_header)
+            parsed += 1
+            rejected += entry is None
+            cpu_seconds += time.thread_time() - resumed
+            yield entry
+            resumed = time.thread_time()
+        cpu_seconds += time.thread_time() - resumed
+    finally:
+        STAGE_SECONDS.observe(cpu_seconds, stage="parse")
+        ROWS_PARSED.inc(parsed)
+        ROWS_REJECTED.inc(rejected)
+
+
+_render_pool_lock = threading.Lock()
+_render_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    from concurrent.futures import ProcessPoolExecutor
 
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            _render_pool = ProcessPoolExecutor(max_workers=RENDER_PROCESSES)
+        return _render_pool
 
-def _convert_entries_to_ics(entries: Iterable[Union[Entry, None]]) -> str:
-    events = [e.to_event() for e in entries if e]
-    cal = Calendar(events=events, prodid="-//Complendar//EN", version="2.0")
-    return IcsCalendarStream.calendar_to_ics(cal)
+
+def _discard_render_pool(pool: ProcessPoolExecutor):
+    """Forget a broken pool, so that the next `_get_render_pool` starts a new one."""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is pool:
+            _render_pool = None
+            RENDER_POOL_FAILURES.inc()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _render_chunks(chunks: list[list[Entry]], dtstamp: str) -> Iterator[str]:
+    """Render chunks on the render pool, in order.
+
+    If a worker dies, the pool is replaced for later calls and the chunks not rendered
+    yet are rendered serially, since a fresh pool could die on the same sheet.
+    """
+    from concurrent.futures.process import BrokenProcessPool
+
+    pool = _get_render_pool()
+    done = 0
+    try:
+        for vevents in pool.map(_render_vevents, chunks, [dtstamp] * len(chunks)):
+            done += 1
+            yield vevents
+    except BrokenProcessPool:
+        _discard_render_pool(pool)
+        for chunk in chunks[done:]:
+            yield _render_vevents(chunk, dtstamp)
+
+
+def _render_vevents(entries: list[Entry], dtstamp: str) -> str:
+    return "\n".join(e.to_ics(dtstamp) for e in entries)
+
+
+def _iter_ics_native(entries: Iterable[Union[Entry, None]], parallel: bool = True) -> Iterator[str]:
+    """Serialize with `Entry.to_ics`, yielding the VCALENDAR header, each VEVENT and the footer.
+
+    Entries are consumed lazily, one row at a time. Large lists are instead rendered
+    in chunks on the render pool; chunks keep their original order and share one
+    DTSTAMP, so the result is identical to rendering serially.
+    """
+    dtstamp = datetime.now(tz=timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    # Events are written as text directly, so there is no separate serialize stage;
+    # build_events times the rendering only, not the consumer of the pieces.
+    rendering = _Stopwatch()
+    try:
+        yield "BEGIN:VCALENDAR\nPRODID:-//Complendar//EN\nVERSION:2.0\n"
+        if parallel and isinstance(entries, list):
+            entries = [e for e in entries if e]
+            if len(entries) >= PARALLEL_RENDER_MIN_ROWS:
+                chunks = [entries[i:i + RENDER_CHUNK_SIZE] for i in range(0, len(entries), RENDER_CHUNK_SIZE)]
+                rendered_chunks = _render_chunks(chunks, dtstamp)
+                for _ in chunks:
+                    with rendering:
+                        vevents = next(rendered_chunks)
+                    yield f"{vevents}\n"
+                yield "END:VCALENDAR"
+                return
+        for e in entries:
+            if e:
+                with rendering:
+                    vevent = e.to_ics(dtstamp)
+                yield f"{vevent}\n"
+        yield "END:VCALENDAR"
+    finally:
+        STAGE_SECONDS.observe(rendering.seconds, stage="build_events")
+
+
+def _iter_ics(
+    entries: Iterable[Union[Entry, None]], native: Optional[bool] = None, parallel: bool = True
+) -> Iterator[str]:
+    """The calendar as a sequence of text pieces; only the built-in serializer yields more than one.
+
+    Unless `native` says otherwise, calendars large enough for the render pool use the
+    built-in serializer even when `NATIVE_ICS` is off; ical would take minutes on them.
+    """
+    if native is None:
+        native = NATIVE_ICS or (parallel and isinstance(entries, list) and len(entries) >= PARALLEL_RENDER_MIN_ROWS)
+    if native:
+        yield from _iter_ics_native(entries, parallel=parallel)
+        return
+    from ical.calendar import Calendar
+    from ical.calendar_stream import IcsCalendarStream
+
+    with _timed("build_events"):
+        events = [e.to_event() for e in entries if e]
+    with _timed("serialize"):
+        cal = Calendar(events=events, prodid="-//Complendar//EN", version="2.0")
+        ics = IcsCalendarStream.calendar_to_ics(cal)
+    yield ics
+
+
+def _convert_entries_to_ics(
+    entries: Iterable[Union[Entry, None]], native: Optional[bool] = None, parallel: bool = True
+) -> str:
+    return "".join(_iter_ics(entries, native=native, parallel=parallel))
+
+
+def _convert_sheet(
+    spreadsheet_link: str,
+    log: Callable[[str], None] = lambda msg: None,
+    progress: Callable[..., None] = lambda stage, **data: None,
+    render: Callable[[list[Optional[Entry]]], str] = _convert_entries_to_ics,
+) -> Conversion:
+    """Run the fetch → parse → serialize pipeline.
+
+    Sheets Google reports as unchanged skip parsing and serializing; CSVs whose digest
+    was converted before skip serializing. `log` receives human-readable messages and
+    `progress` structured stage events (`fetch`, `bytes`, `headers`, `parsed`,
+    `unchanged`, `rendered`) with per-stage `seconds` where a stage has finished.
+    `render` turns the parsed entries into ICS text, e.g. in another process.
+    """
+    started = time.perf_counter()
+    progress("fetch")
+    with _get_csv_from_sheets(spreadsheet_link, on_bytes=lambda n: progress("bytes", bytes=n)) as fetched:
+        if fetched.not_modified:
+            log("Sheet unchanged since the last conversion, reusing it.")
+            progress("unchanged", seconds=time.perf_counter() - started)
+            return fetched.cached.conversion
+        log("Parsing CSV…")
+        rows, (name_header, birthday_header) = _format_csv(fetched.lines)
+        log(f"Guessed headers\n→ Name: \"{name_header}\"\n→ Birthday: \"{birthday_header}\"")
+        progress("headers", name=name_header, birthday=birthday_header)
+        entries = list(rows)
+    valid_entries = sum(1 for e in entries if e)
+    parsed = time.perf_counter()
+    progress("parsed", rows=len(entries), entries=valid_entries, seconds=parsed - started)
+
+    digest = fetched.digest.hexdigest()
+    conversion = _conversion_cache.get(digest)
+    cached = conversion is not None
+    if cached:
+        log("This CSV was converted before, reusing the calendar.")
+    else:
+        log("Converting to ICS…")
+        conversion = Conversion(render(entries), (name_header, birthday_header), digest)
+        _conversion_cache.put(conversion)
+    progress("rendered", events=valid_entries, cached=cached, seconds=time.perf_counter() - parsed)
+    _remember_conversion(fetched, conversion)
+    return conversion
+
+
+_conversions = _SingleFlight()
+METRICS.callback(
+    "complendar_conversions_total", "counter", "Conversions run for /api/convert, jobs and subscriptions.",
+    lambda: _conversions.calls,
+)
+METRICS.callback(
+    "complendar_conversions_coalesced_total", "counter",
+    "Requests that reused a conversion of the same sheet already in progress.",
+    lambda: _conversions.shared,
+)
+
+
+def _convert_sheet_coalesced(spreadsheet_link: str) -> Conversion:
+    """`_convert_sheet`, except that concurrent calls for the same sheet and gid share one conversion."""
+    conversion, _ = _conversions.do(_sheet_key(spreadsheet_link), lambda: _convert_sheet(spreadsheet_link))
+    return conversion
+
+
+@contextmanager
+def _stream_sheet_ics(
+    spreadsheet_link: str, log: Callable[[str], None] = lambda msg: None
+) -> Iterator[Tuple[Tuple[str, str], Iterator[str]]]:
+    """Like `_convert_sheet`, but yields the guessed headers and the calendar as text pieces.
+
+    Rows are parsed and rendered as the CSV arrives, so the whole calendar is never
+    held in memory; the pieces are only valid inside the `with` block. Nothing is
+    cached, except that a sheet Google reports as unchanged reuses its last conversion.
+    Only the built-in serializer can render row by row, so it is used whatever
+    `NATIVE_ICS` says; its output is identical to ical's.
+    """
+    with _get_csv_from_sheets(spreadsheet_link) as fetched:
+        if fetched.not_modified:
+            log("Sheet unchanged since the last conversion, reusing it.")
+            yield fetched.cached.conversion.headers, iter([fetched.cached.conversion.ics])
+            return
+        log("Parsing CSV…")
+        rows, (name_header, birthday_header) = _format_csv(fetched.lines)
+        log(f"Guessed headers\n→ Name: \"{name_header}\"\n→ Birthday: \"{birthday_header}\"")
+        log("Converting to ICS…")
+        yield (name_header, birthday_header), _iter_ics(rows, native=True)
 
 
 # ---------------- CLI MODE ----------------
 def cli_main(link: str, output: Optional[str] = None):
     print(f"Fetching CSV from: {link}")
-    csv_bytes = _get_csv_from_sheets(link)
-    print("Parsing CSV…")
-    entries, (name_header, birthday_header) = _format_csv(csv_bytes)
-    print(f"Guessed headers\n→ Name: \"{name_header}\"\n→ Birthday: \"{birthday_header}\"")
-    print("Converting to ICS…")
-    ical = _convert_entries_to_ics(entries)
     output_path = Path(output or f"complendar_{uuid4().hex}.ics")
-    output_path.write_text(ical, encoding="utf-8")
+    partial_path = output_path.with_name(f".{output_path.name}.part")
+    try:
+        with _stream_sheet_ics(link, log=print) as (_, ics_pieces):
+            with partial_path.open("w", encoding="utf-8") as f:
+                f.writelines(ics_pieces)
+        partial_path.replace(output_path)
+    finally:
+        partial_path.unlink(missing_ok=True)
     print(f"✅ Done. Saved to {output_path}")
 
 
+# ---------------- BATCH MODE ----------------
+class BatchResult(NamedTuple):
+    link: str
+    output: Optional[Path]
+    rows: int = 0
+    events: int = 0
+    parse_seconds: float = 0.0  # fetching and parsing overlap, so they are timed together
+    render_seconds: float = 0.0
+    total_seconds: float = 0.0
+    error: Optional[str] = None
+
+
+def _read_links(source: str) -> list[str]:
+    """Links from a file (or stdin for `-`), one per line; blank lines and `#` comments are skipped."""
+    text = sys.stdin.read() if source == "-" else Path(source).read_text(encoding="utf-8")
+    return [line.strip() for line in text.splitlines() if line.strip() and not line.lstrip().startswith("#")]
+
+
+def _convert_batch_link(link: str, output_dir: Path, render_pool: ProcessPoolExecutor) -> BatchResult:
+    started = time.perf_counter()
+    stages = {}
+    try:
+        spreadsheet_id, gid = _sheet_key(link)
+        conversion = _convert_sheet(
+            link,
+            progress=lambda stage, **data: stages.__setitem__(stage, data),
+            render=lambda entries: render_pool.submit(_convert_entries_to_ics, entries, parallel=False).result(),
+        )
+        output_path = output_dir / f"complendar_{spreadsheet_id}_{gid}.ics"
+        output_path.write_text(conversion.ics, encoding="utf-8")
+    except Exception as e:
+        return BatchResult(link, None, total_seconds=time.perf_counter() - started, error=(str(e) or type(e).__name__).splitlines()[0])
+    parsed, rendered = stages.get("parsed", {}), stages.get("rendered", {})
+    return BatchResult(
+        link,
+        output_path,
+        rows=parsed.get("rows", 0),
+        events=rendered.get("events", 0),
+        parse_seconds=parsed.get("seconds", stages.get("unchanged", {}).get("seconds", 0.0)),
+        render_seconds=rendered.get("seconds", 0.0),
+        total_seconds=time.perf_counter() - started,
+    )
+
+
+def _print_batch_summary(results: list[BatchResult]):
+    print(f"{'Link':<48} {'Rows':>7} {'Events':>7} {'Parse':>8} {'Render':>8} {'Total':>8}  Result")
+    for r in results:
+        link = r.link if len(r.link) <= 48 else f"{r.link[:47]}…"
+        outcome = f"❌ {r.error}" if r.error else f"✅ {r.output}"
+        print(
+            f"{link:<48} {r.rows:>7} {r.events:>7} {r.parse_seconds:>7.2f}s {r.render_seconds:>7.2f}s "
+            f"{r.total_seconds:>7.2f}s  {outcome}"
+        )
+    failed = sum(1 for r in results if r.error)
+    print(f"{len(results) - failed} converted, {failed} failed.")
+
+
+def batch_main(
+    source: str,
+    output_dir: Optional[str] = None,
+    connections: int = BATCH_CONNECTIONS,
+    processes: Optional[int] = BATCH_PROCESSES,
+) -> list[BatchResult]:
+    """Convert every link in `source` concurrently, writing one calendar per link.
+
+    At most `connections` sheets are fetched at once; rendering runs on a pool of
+    `processes` worker processes so it is not serialized on one core.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    links = _read_links(source)
+    out = Path(output_dir or ".")
+    out.mkdir(parents=True, exist_ok=True)
+    print(f"Converting {len(links)} links ({connections} connections, {processes or os.cpu_count()} processes)…")
+    with ProcessPoolExecutor(max_workers=processes) as render_pool, ThreadPoolExecutor(connections) as fetch_pool:
+        results = list(fetch_pool.map(lambda link: _convert_batch_link(link, out, render_pool), links))
+    _print_batch_summary(results)
+    return results
+
+
+# ---------------- ARTIFACT STORE ----------------
+class ArtifactStore(ABC):
+    """Where generated calendars live until they are downloaded."""
+
+    @abstractmethod
+    def put(self, name: str, data: bytes):
+        ...
+
+    @abstractmethod
+    def get(self, name: str) -> Optional[bytes]:
+        ...
+
+    def open(self, name: str) -> Optional[BinaryIO]:
+        """The artifact as a binary file. File-backed stores return the file itself, for `socket.sendfile`."""
+        data = self.get(name)
+        return None if data is None else BytesIO(data)
+
+    def touch(self, name: str) -> bool:
+        """Restart the artifact's time to live. False if there is no such artifact."""
+        data = self.get(name)
+        if data is None:
+            return False
+        self.put(name, data)
+        return True
+
+
+class MemoryArtifactStore(ArtifactStore):
+    """In-process LRU bounded by total size in bytes and by age.
+
+    The newest artifact is always kept, even if it alone exceeds `max_bytes`.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._items: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def put(self, name: str, data: bytes):
+        with self._lock:
+            self._discard(name)
+            self._items[name] = (time.monotonic() + self.ttl, data)
+            self._size += len(data)
+            while self._size > self.max_bytes and len(self._items) > 1:
+                self._discard(next(iter(self._items)))
+
+    def get(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            item = self._items.get(name)
+            if item is None:
+                return None
+            expires, data = item
+            if expires < time.monotonic():
+                self._discard(name)
+                return None
+            self._items.move_to_end(name)
+            return data
+
+    def touch(self, name: str) -> bool:
+        with self._lock:
+            item = self._items.get(name)
+            if item is None or item[0] < time.monotonic():
+                return False
+            self._items[name] = (time.monotonic() + self.ttl, item[1])
+            self._items.move_to_end(name)
+            return True
+
+    def _discard(self, name: str):
+        item = self._items.pop(name, None)
+        if item is not None:
+            self._size -= len(item[1])
+
+
+class DiskArtifactStore(ArtifactStore):
+    """Artifacts as files in `directory`, evicting the oldest once over `max_bytes` or `ttl`."""
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int, ttl: float):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, name: str) -> Optional[Path]:
+        if not name or name.startswith(".") or "/" in name or os.sep in name:
+            return None
+        return self.directory / name
+
+    def put(self, name: str, data: bytes):
+        path = self._path(name)
+        if path is None:
+            raise ValueError(f"Invalid artifact name: {name!r}")
+        with self._lock:
+            tmp_path = path.with_name(f".{name}.tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.replace(path)
+            self._evict(keep=path)
+
+    def get(self, name: str) -> Optional[bytes]:
+        path = self._path(name)
+        try:
+            if path is None or path.stat().st_mtime + self.ttl < time.time():
+                return None
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def open(self, name: str) -> Optional[BinaryIO]:
+        # The open descriptor keeps the file readable even if it is evicted meanwhile.
+        path = self._path(name)
+        try:
+            f = path.open("rb") if path is not None else None
+        except FileNotFoundError:
+            return None
+        if f is not None and os.fstat(f.fileno()).st_mtime + self.ttl < time.time():
+            f.close()
+            return None
+        return f
+
+    def touch(self, name: str) -> bool:
+        # The mtime is both the age and the eviction order, so this also makes it the newest.
+        path = self._path(name)
+        try:
+            if path is None or path.stat().st_mtime + self.ttl < time.time():
+                return False
+            os.utime(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def _evict(self, keep: Path):
+        files = []
+        for path in self.directory.iterdir():
+            if path.name.startswith("."):
+                continue
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((st.st_mtime, st.st_size, path))
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        expired_before = time.time() - self.ttl
+        for mtime, size, path in files:
+            if path != keep and (mtime < expired_before or total > self.max_bytes):
+                path.unlink(missing_ok=True)
+                total -= size
+
+
+class TieredArtifactStore(ArtifactStore):
+    """A memory tier in front of a disk tier; writes go to both, disk hits are promoted."""
+
+    def __init__(self, memory: ArtifactStore, disk: ArtifactStore):
+        self.memory = memory
+        self.disk = disk
+
+    def put(self, name: str, data: bytes):
+        self.disk.put(name, data)
+        self.memory.put(name, data)
+
+    def get(self, name: str) -> Optional[bytes]:
+        data = self.memory.get(name)
+        if data is None:
+            data = self.disk.get(name)
+            if data is not None:
+                self.memory.put(name, data)
+        return data
+
+    def open(self, name: str) -> Optional[BinaryIO]:
+        # Disk hits are sent straight from the file rather than promoted, so serving a
+        # download never reads it into memory.
+        return self.memory.open(name) or self.disk.open(name)
+
+    def touch(self, name: str) -> bool:
+        # Only the disk tier has to have it; the memory tier is refreshed if it does too.
+        if not self.disk.touch(name):
+            return False
+        self.memory.touch(name)
+        return True
+
+
+@functools.cache
+def _default_artifact_store() -> ArtifactStore:
+    memory = MemoryArtifactStore(ARTIFACT_MAX_BYTES, ARTIFACT_TTL)
+    if not ARTIFACT_DIR:
+        return memory
+    return TieredArtifactStore(memory, DiskArtifactStore(ARTIFACT_DIR, ARTIFACT_DISK_MAX_BYTES, ARTIFACT_TTL))
+
+
+# ---------------- JOBS ----------------
+@dataclass
+class Job:
+    id: str
+    state: str = "queued"  # queued → running → done | failed
+    queued_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[dict] = None
+    error: Optional[str] = None
+
+    def to_json(self) -> dict:
+        timings = {"queued_at": self.queued_at, "started_at": self.started_at, "finished_at": self.finished_at}
+        if self.started_at is not None:
+            timings["queue_seconds"] = self.started_at - self.queued_at
+        if self.finished_at is not None:
+            timings["run_seconds"] = self.finished_at - self.started_at
+        return {"id": self.id, "state": self.state, "timings": timings, "result": self.result, "error": self.error}
+
+
+class JobRunner:
+    """Runs conversions in the background on a bounded pool and remembers recent jobs."""
+
+    def __init__(self, workers: int, queue_depth: int, max_jobs: int = 1000):
+        self.max_jobs = max_jobs
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="complendar-job")
+        self._slots = threading.BoundedSemaphore(workers + queue_depth)
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable[[], dict]) -> Optional[Job]:
+        """Queue `fn`, whose return value becomes the job result; None when the queue is full."""
+        if not self._slots.acquire(blocking=False):
+            return None
+        job = Job(id=uuid4().hex)
+        with self._lock:
+            self._jobs[job.id] = job
+            while len(self._jobs) > self.max_jobs:
+                self._jobs.popitem(last=False)
+        self._executor.submit(self._run, job, fn)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job: Job, fn: Callable[[], dict]):
+        job.started_at, job.state = time.time(), "running"
+        try:
+            job.result, job.state = fn(), "done"
+        except Exception as e:
+            job.error, job.state = str(e), "failed"
+        finally:
+            job.finished_at = time.time()
+            self._slots.release()
+
+
+@functools.cache
+def _default_job_runner() -> JobRunner:
+    return JobRunner(JOB_WORKERS, JOB_QUEUE_DEPTH)
+
+
+# ---------------- SUBSCRIPTIONS ----------------
+class _Subscription(NamedTuple):
+    expires: float  # time.monotonic() after which the sheet is checked again
+    body: bytes
+    etag: str
+    compressed: dict[str, bytes]  # body by content encoding, filled in on first request
+
+
+class CalendarSubscriptions:
+    """Calendars served at /calendar/, refreshed through `_convert_sheet_coalesced` once older than `ttl`.
+
+    Concurrent requests for a missing or stale calendar share one fetch and render. If a
+    refresh fails, the stale calendar is served rather than an error.
+    """
+
+    def __init__(self, ttl: float, max_size: int, max_bytes: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self._items: "OrderedDict[Tuple[str, str], _Subscription]" = OrderedDict()
+        self._size = 0  # uncompressed bodies only; compressed variants are smaller still
+        self._lock = threading.Lock()
+        self._refreshes = _SingleFlight()
+
+    def get(self, spreadsheet_link: str) -> _Subscription:
+        key = _sheet_key(spreadsheet_link)
+        cached = self._fresh(key)
+        if cached is not None:
+            return cached
+        try:
+            subscription, _ = self._refreshes.do(key, lambda: self._refresh(key, spreadsheet_link))
+        except Exception:
+            with self._lock:
+                stale = self._items.get(key)
+            if stale is None:
+                raise
+            return stale
+        return subscription
+
+    def _fresh(self, key: Tuple[str, str]) -> Optional[_Subscription]:
+        with self._lock:
+            cached = self._items.get(key)
+            if cached is None or cached.expires < time.monotonic():
+                return None
+            self._items.move_to_end(key)
+            return cached
+
+    def _refresh(self, key: Tuple[str, str], spreadsheet_link: str) -> _Subscription:
+        # Another refresh may have finished between the caller's check and this one starting.
+        cached = self._fresh(key)
+        if cached is not None:
+            return cached
+        body = _convert_sheet_coalesced(spreadsheet_link).ics.encode("utf-8")
+        subscription = _Subscription(time.monotonic() + self.ttl, body, f'"{sha256(body).hexdigest()[:32]}"', {})
+        with self._lock:
+            self._discard(key)
+            self._items[key] = subscription
+            self._size += len(body)
+            while len(self._items) > 1 and (len(self._items) > self.max_size or self._size > self.max_bytes):
+                self._discard(next(iter(self._items)))
+        return subscription
+
+    def _discard(self, key: Tuple[str, str]):
+        subscription = self._items.pop(key, None)
+        if subscription is not None:
+            self._size -= len(subscription.body)
+
+
+@functools.cache
+def _default_subscriptions() -> CalendarSubscriptions:
+    return CalendarSubscriptions(CALENDAR_TTL, SHEET_CACHE_SIZE, CALENDAR_MAX_BYTES)
+
+
 # ---------------- WEB SERVER ----------------
+# Versioned static URLs and downloads never change, so clients may keep them for a year.
+IMMUTABLE_CACHE_CONTROL = f"public, max-age={365 * 24 * 60 * 60}, immutable"
+# Responses smaller than this are not worth compressing.
+COMPRESS_MIN_BYTES = 1024
+CALENDAR_PATH = com(r"^/calendar/(?P<spreadsheet_id>[^/]{44})\.ics$")
+# Relative script and stylesheet references in HTML pages, which get a `?v=<hash>` appended.
+_STATIC_REFERENCE = com(r'(?P<attr>\b(?:src|href))="(?P<url>[^":?#]+\.(?:js|css))"')
+
+
+def _publish_conversion(conversion: Conversion, artifacts: ArtifactStore) -> dict:
+    """Store the calendar for /download/ and describe it for API clients."""
+    # Named after a hash of the calendar itself, so a download URL always serves the
+    # same bytes and its name doubles as a strong ETag.
+    data = conversion.ics.encode("utf-8")
+    filename = f"complendar_{sha256(data).hexdigest()[:32]}.ics"
+    # Converting it again restarts its time to live, as if it had just been written.
+    if not artifacts.touch(filename):
+        artifacts.put(filename, data)
+    name_header, birthday_header = conversion.headers
+    return {
+        "file": f"/download/{filename}",
+        "guessed_headers": {"name": name_header, "birthday": birthday_header},
+    }
+
+
+def _accepted_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """The preferred of `br` and `gzip` among those the client accepts, or None for no compression."""
+    qualities = {}
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qualities[coding.strip().lower()] = q
+    supported = ("br", "gzip") if _brotli() is not None else ("gzip",)
+    accepted = {coding: qualities.get(coding, qualities.get("*", 0.0)) for coding in supported}
+    # On equal quality, br wins: it is listed first and max() keeps the first maximum.
+    best = max(supported, key=accepted.__getitem__)
+    return best if accepted[best] > 0 else None
+
+
+def _compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return _brotli().compress(data, quality=9)
+    import gzip
+
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison, so W/ prefixes are ignored.
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+class _StaticAsset(NamedTuple):
+    body: bytes
+    digest: str
+
+
+@functools.lru_cache(maxsize=64)
+def _read_static_asset(path: Path, mtime_ns: int, size: int) -> _StaticAsset:
+    # mtime and size are part of the key, so edited files are picked up without a restart.
+    body = path.read_bytes()
+    return _StaticAsset(body, sha256(body).hexdigest()[:32])
+
+
+def _static_asset(path: Path) -> _StaticAsset:
+    """A static file, with the scripts and stylesheets an HTML page references versioned by content."""
+    st = path.stat()
+    asset = _read_static_asset(path, st.st_mtime_ns, st.st_size)
+    if path.suffix != ".html":
+        return asset
+
+    def versioned(m) -> str:
+        target = path.parent / m["url"]
+        if not target.is_file():
+            return m[0]
+        return f'{m["attr"]}="{m["url"]}?v={_static_asset(target).digest[:12]}"'
+
+    # Rewritten on every request, so a page never points at an outdated version.
+    body = _STATIC_REFERENCE.sub(versioned, asset.body.decode("utf-8")).encode("utf-8")
+    return _StaticAsset(body, sha256(body).hexdigest()[:32])
+
+
+# Compressing a download for the first time, so concurrent first requests do it once.
+_compressions = _SingleFlight()
+
+
 class ComplendarHandler(http.server.SimpleHTTPRequestHandler):
+    # Set to plug in another store; defaults to the one configured by COMPLENDAR_ARTIFACT_*.
+    artifact_store: Optional[ArtifactStore] = None
+
+    @property
+    def artifacts(self) -> ArtifactStore:
+        return self.artifact_store or _default_artifact_store()
+
+    def _send_json(self, status: int, payload: dict):
+        self._send_compressible(status, "application/json", json.dumps(payload).encode())
+
+    def _send_compressible(self, status: int, content_type: str, body: bytes):
+        """Send a dynamic response, compressed on the fly if it is large enough and the client accepts it."""
+        encoding = _accepted_encoding(self.headers.get("Accept-Encoding")) if len(body) >= COMPRESS_MIN_BYTES else None
+        if encoding:
+            body = _compress(body, encoding)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Vary", "Accept-Encoding")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> dict:
+        content_length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(content_length)
+        return json.loads(body)
+
     def do_POST(self):
         if self.path == "/api/convert":
-            content_length = int(self.headers.get("Content-Length", 0))
-            body = self.rfile.read(content_length)
-            data = json.loads(body)
+            data = self._read_json()
             try:
                 link = data.get("link")
-                csv_bytes = _get_csv_from_sheets(link)
-                entries, headers = _format_csv(csv_bytes)
-                ical = _convert_entries_to_ics(entries)
-                filename = f"complendar_{uuid4().hex}.ics"
-                file_path = Path(gettempdir()) / filename
-                file_path.write_text(ical, encoding="utf-8")
-                self.send_response(200)
-                self.send_header("Content-Type", "application/json")
-                self.end_headers()
-                self.wfile.write(json.dumps({
-                    "file": f"/download/{filename}",
-                    "guessed_headers": {"name": headers[0], "birthday": headers[1]}
-                }).encode())
+                self._send_json(200, _publish_conversion(_convert_sheet_coalesced(link), self.artifacts))
             except Exception as e:
-                self.send_response(400)
-                self.send_header("Content-Type", "application/json")
-                self.end_headers()
-                self.wfile.write(json.dumps({"error": str(e)}).encode())
+                self._send_json(400, {"error": str(e)})
+
+        elif self.path == "/api/jobs":
+            data = self._read_json()
+            link, artifacts = data.get("link"), self.artifacts
+            try:
+                _sheet_key(link or "")
+            except ValueError as e:
+                self._send_json(400, {"error": str(e)})
+                return
+            job = _default_job_runner().submit(lambda: _publish_conversion(_convert_sheet_coalesced(link), artifacts))
+            if job is None:
+                self._send_json(503, {"error": "Too many conversions queued, try again shortly."})
+            else:
+                self._send_json(202, {**job.to_json(), "status": f"/api/jobs/{job.id}"})
 
         else:
             self.send_error(404)
 
-    def do_GET(self):
-        if self.path.startswith("/download/"):
-            filename = self.path.split("/")[-1]
-            file_path = Path(gettempdir()) / filename
-            if file_path.exists():
+    def _send_not_modified(self, etag: str, cache_control: str, negotiated: bool = False) -> bool:
+        """Answer 304 if the client's copy is current, returning whether it did."""
+        if not _etag_matches(self.headers.get("If-None-Match"), etag):
+            return False
+        self.send_response(304)
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", cache_control)
+        if negotiated:
+            self.send_header("Vary", "Accept-Encoding")
+        self.end_headers()
+        return True
+
+    def _send_cacheable_headers(
+        self, content_type: str, length: int, etag: str, cache_control: str, encoding: Optional[str]
+    ):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(length))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", cache_control)
+        self.send_header("Vary", "Accept-Encoding")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+
+    def _static_file(self) -> Optional[Path]:
+        """The file in the static directory this request is for, if there is one."""
+        if self.path == "/":
+            self.path = "/index.html"
+        path = Path(self.translate_path(self.path))
+        return path if path.is_file() else None
+
+    def _send_static(self, path: Path, head: bool = False):
+        asset = _static_asset(path)
+        etag = f'"{asset.digest}"'
+        version = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query).get("v", [""])[0]
+        # Only the current version may be cached for good; pages, unversioned URLs and
+        # outdated or made-up versions are revalidated on every use.
+        cache_control = IMMUTABLE_CACHE_CONTROL if version == asset.digest[:12] else "no-cache"
+        if self._send_not_modified(etag, cache_control):
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", self.guess_type(str(path)))
+        self.send_header("Content-Length", str(len(asset.body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", cache_control)
+        self.end_headers()
+        if not head:
+            self.wfile.write(asset.body)
+
+    def _send_subscription(self, url: urllib.parse.SplitResult):
+        m = CALENDAR_PATH.match(url.path)
+        gid = urllib.parse.parse_qs(url.query).get("gid", ["0"])[0]
+        if not m or not gid.isdigit():
+            self.send_error(404)
+            return
+        link = f"{SHEETS_BASE_URL}/spreadsheets/d/{m['spreadsheet_id']}/edit#gid={gid}"
+        try:
+            calendar = _default_subscriptions().get(link)
+        except Exception as e:
+            self._send_json(502, {"error": str(e)})
+            return
+        # Clients may keep the calendar for as long as the server would serve it unchanged.
+        cache_control = f"public, max-age={max(0, int(calendar.expires - time.monotonic()))}"
+        encoding = _accepted_encoding(self.headers.get("Accept-Encoding"))
+        # Each encoding is a separate representation, so it needs its own strong ETag.
+        etag = f'{calendar.etag[:-1]}-{encoding}"' if encoding else calendar.etag
+        if self._send_not_modified(etag, cache_control, negotiated=True):
+            return
+        body = calendar.body
+        if encoding:
+            body = calendar.compressed.get(encoding) or calendar.compressed.setdefault(
+                encoding, _compress(calendar.body, encoding)
+            )
+        self._send_cacheable_headers("text/calendar; charset=utf-8", len(body), etag, cache_control, encoding)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _open_compressed_download(self, filename: str, f: BinaryIO, encoding: str) -> Optional[BinaryIO]:
+        """The download compressed with `encoding`, made and stored next to it on first request."""
+        name = f"{filename}.{encoding}"
+        compressed = self.artifacts.open(name)
+        if compressed is None:
+            data = f.read()
+            f.seek(0)
+            _compressions.do((id(self.artifacts), name), lambda: self.artifacts.put(name, _compress(data, encoding)))
+            compressed = self.artifacts.open(name)
+        return compressed
+
+    def _send_download(self, filename: str, f: BinaryIO):
+        stem = filename.removesuffix(".ics")
+        encoding = _accepted_encoding(self.headers.get("Accept-Encoding"))
+        if self._send_not_modified(f'"{stem}-{encoding}"' if encoding else f'"{stem}"', IMMUTABLE_CACHE_CONTROL, True):
+            return
+        compressed = self._open_compressed_download(filename, f, encoding) if encoding else None
+        if compressed is None:
+            # Not stored, e.g. evicted right away; the plain file is always a valid answer.
+            self._write_download(filename, f, f'"{stem}"', None)
+            return
+        with compressed:
+            self._write_download(filename, compressed, f'"{stem}-{encoding}"', encoding)
+
+    def _write_download(self, filename: str, f: BinaryIO, etag: str, encoding: Optional[str]):
+        size = f.seek(0, os.SEEK_END)
+        f.seek(0)
+        self._send_cacheable_headers("text/calendar", size, etag, IMMUTABLE_CACHE_CONTROL, encoding)
+        self.send_header("Content-Disposition", f"attachment; filename={filename}")
+        self.end_headers()
+        if isinstance(f, BytesIO):
+            # A whole-buffer read() hands back the stored bytes object itself, whereas
+            # getbuffer() would copy the calendar to unshare it.
+            self.wfile.write(f.read())
+        else:
+            # Zero-copy: the kernel sends the file without it passing through Python.
+            self.connection.sendfile(f)
+
+    def _send_conversion_events(self, link: str):
+        """Run a conversion, reporting each stage as a Server-Sent Event.
+
+        If the same sheet is already being converted, a `coalesced` event replaces the
+        stage events and the result of that conversion is reused.
+        """
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        started = time.perf_counter()
+        last_bytes_event = float("-inf")
+        disconnected = False
+
+        def emit(stage: str, **data):
+            nonlocal last_bytes_event, disconnected
+            now = time.perf_counter()
+            if disconnected or stage == "bytes" and now - last_bytes_event < SSE_BYTES_INTERVAL:
+                return
+            if stage == "bytes":
+                last_bytes_event = now
+            payload = json.dumps({"stage": stage, "elapsed": now - started, **data})
+            try:
+                self.wfile.write(f"data: {payload}\n\n".encode())
+            except (BrokenPipeError, ConnectionResetError):
+                # The browser went away, but other requests may be waiting on this
+                # conversion, so it carries on without reporting progress.
+                disconnected = True
+
+        try:
+            conversion, _ = _conversions.do(
+                _sheet_key(link), lambda: _convert_sheet(link, progress=emit), on_shared=lambda: emit("coalesced")
+            )
+            emit("done", **_publish_conversion(conversion, self.artifacts))
+        except Exception as e:
+            emit("error", error=str(e))
+
+    def _send_calendar_stream(self, link: str):
+        """Convert while sending the calendar with chunked transfer encoding as it is rendered."""
+        responded = False
+        try:
+            with _stream_sheet_ics(link) as (_, ics_pieces):
+                responded = True
+                chunked = self.request_version == "HTTP/1.1"
+                if chunked:
+                    self.protocol_version = "HTTP/1.1"
                 self.send_response(200)
-                self.send_header("Content-Type", "text/calendar")
-                self.send_header(
-                    "Content-Disposition", f"attachment; filename={filename}"
-                )
+                self.send_header("Content-Type", "text/calendar; charset=utf-8")
+                self.send_header("Content-Disposition", "attachment; filename=complendar.ics")
+                if chunked:
+                    self.send_header("Transfer-Encoding", "chunked")
+                self.send_header("Connection", "close")
                 self.end_headers()
-                self.wfile.write(file_path.read_bytes())
+                self._write_stream((piece.encode("utf-8") for piece in ics_pieces), chunked)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # The client went away; abandon the conversion.
+        except Exception as e:
+            if not responded:
+                self._send_json(400, {"error": str(e)})
+            else:
+                # Too late for an error status; dropping the connection before the
+                # final chunk tells the client the calendar is incomplete.
+                self.log_error("Calendar stream for %s failed: %s", link, e)
+
+    def _write_stream(self, pieces: Iterable[bytes], chunked: bool, chunk_size: int = 16 * 1024):
+        def write(data: bytes):
+            self.wfile.write(b"%X\r\n%s\r\n" % (len(data), data) if chunked else data)
+
+        buffer = bytearray()
+        for piece in pieces:
+            buffer += piece
+            if len(buffer) >= chunk_size:
+                write(bytes(buffer))
+                buffer.clear()
+        if buffer:
+            write(bytes(buffer))
+        if chunked:
+            self.wfile.write(b"0\r\n\r\n")
+
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        if url.path == "/api/convert/events":
+            link = urllib.parse.parse_qs(url.query).get("link", [""])[0]
+            self._send_conversion_events(link)
+        elif url.path == "/api/convert/ics":
+            link = urllib.parse.parse_qs(url.query).get("link", [""])[0]
+            self._send_calendar_stream(link)
+        elif url.path == "/metrics":
+            self._send_compressible(200, "text/plain; version=0.0.4; charset=utf-8", METRICS.render().encode())
+        elif url.path.startswith("/calendar/"):
+            self._send_subscription(url)
+        elif self.path.startswith("/api/jobs/"):
+            job = _default_job_runner().get(self.path.split("/")[-1])
+            if job is not None:
+                self._send_json(200, job.to_json())
+            else:
+                self.send_error(404)
+        elif self.path.startswith("/download/"):
+            filename = self.path.split("/")[-1]
+            # Compressed variants are stored as `<name>.gzip`/`.br` and only served by negotiation.
+            f = self.artifacts.open(filename) if filename.endswith(".ics") else None
+            if f is not None:
+                with f:
+                    self._send_download(filename, f)
             else:
                 self.send_error(404)
         else:
-            if self.path == "/":
-                self.path = "/index.html"
-            return super().do_GET()
+            path = self._static_file()
+            if path is None:
+                return super().do_GET()
+            self._send_static(path)
+
+    def do_HEAD(self):
+        path = self._static_file()
+        if path is None:
+            return super().do_HEAD()
+        self._send_static(path, head=True)
+
+
+class PooledHTTPServer(http.server.HTTPServer):
+    """An HTTP server that handles requests on a bounded pool of worker threads.
+
+    At most `workers` requests run at once and up to `queue_depth` more wait for a
+    free worker; connections beyond that are answered with 503 straight away, so a
+    slow Google fetch never blocks static assets or downloads for other clients.
+    """
+
+    def __init__(self, server_address, handler_class, workers: int, queue_depth: int):
+        super().__init__(server_address, handler_class)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="complendar-http")
+        self._slots = threading.BoundedSemaphore(workers + queue_depth)
+
+    def process_request(self, request, client_address):
+        if not self._slots.acquire(blocking=False):
+            self._reject(request)
+            return
+        self._executor.submit(self._process_request_worker, request, client_address)
+
+    def _process_request_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self._slots.release()
+
+    def _reject(self, request):
+        try:
+            request.sendall(
+                b"HTTP/1.0 503 Service Unavailable\r\n"
+                b"Retry-After: 1\r\nContent-Length: 0\r\nConnection: close\r\n\r\n"
+            )
+        except OSError:
+            pass
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self._executor.shutdown(wait=True)
 
 
-def run_web_server():
-    PORT = 8000
+def run_web_server(workers: int = SERVER_WORKERS, queue_depth: int = SERVER_QUEUE_DEPTH):
+    STATIC_DIR.mkdir(exist_ok=True)
     handler = functools.partial(ComplendarHandler, directory=str(STATIC_DIR))
-    print(f"🌐 Running on http://localhost:{PORT}")
-    with socketserver.TCPServer(("", PORT), handler) as httpd:
+    print(f"🌐 Running on http://localhost:{PORT} ({workers} workers, queue depth {queue_depth})")
+    with PooledHTTPServer(("", PORT), handler, workers, queue_depth) as httpd:
         httpd.serve_forever()
 
 
 # ---------------- ENTRY POINT ----------------
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
+    if len(sys.argv) > 2 and sys.argv[1] == "--batch":
+        batch_results = batch_main(sys.argv[2], sys.argv[3] if len(sys.argv) > 3 else None)
+        sys.exit(1 if any(r.error for r in batch_results) else 0)
+    elif len(sys.argv) > 1:
         cli_main(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
     else:
         run_web_server()
@@ -30,10 +30,75 @@ document.addEventListener("DOMContentLoaded", () => {
     logs.scrollTop = logs.scrollHeight; // Auto-scroll to bottom
   }
 
+  /**
+   * Formats a byte count for the log.
+   * @param {number} bytes - The number of bytes.
+   * @returns {string} The human-readable size.
+   */
+  function formatBytes(bytes) {
+    if (bytes < 1024) return `${bytes} B`;
+    if (bytes < 1024 * 1024) return `${(bytes / 1024).toFixed(1)} KB`;
+    return `${(bytes / (1024 * 1024)).toFixed(1)} MB`;
+  }
+
+  /**
+   * Logs one progress event from the conversion event stream.
+   * @param {object} event - The parsed event, with `stage` and `elapsed` seconds.
+   * @returns {boolean} Whether this was the final event of the stream.
+   */
+  function logStage(event) {
+    const at = `${event.elapsed.toFixed(2)}s`;
+    switch (event.stage) {
+      case "fetch":
+        log("Fetching sheet...", "info");
+        return false;
+      case "bytes":
+        log(`Received ${formatBytes(event.bytes)} (${at})`, "info");
+        return false;
+      case "headers":
+        log(
+          `Guessed headers\n→ Name: "${event.name}"\n→ Birthday: "${event.birthday}"`,
+          "info"
+        );
+        return false;
+      case "parsed":
+        log(
+          `Parsed ${event.rows} rows, ${event.entries} with a valid birthday (${event.seconds.toFixed(2)}s)`,
+          "info"
+        );
+        return false;
+      case "coalesced":
+        log("This sheet is already being converted, waiting for it...", "info");
+        return false;
+      case "unchanged":
+        log(`Sheet unchanged since the last conversion (${at})`, "info");
+        return false;
+      case "rendered":
+        log(
+          event.cached
+            ? `Reused a previous calendar with ${event.events} events (${event.seconds.toFixed(2)}s)`
+            : `Rendered ${event.events} events (${event.seconds.toFixed(2)}s)`,
+          "info"
+        );
+        return false;
+      case "done":
+        dlLink.href = event.file;
+        dlLink.style.display = "block";
+        log(`Conversion successful in ${at}. You can now download the file.`, "success");
+        return true;
+      case "error":
+        log(`Error: ${event.error}`, "error");
+        return true;
+      default:
+        return false;
+    }
+  }
+
   /**
    * Handles the conversion process when the button is clicked.
+   * Progress is streamed from the server as Server-Sent Events.
    */
-  async function convert() {
+  function convert() {
     const link = linkInput.value.trim();
 
     if (!link) {
@@ -42,32 +107,18 @@ document.addEventListener("DOMContentLoaded", () => {
     }
     dlLink.style.display = "none";
     logs.innerHTML = ""; // Clear previous logs
-    log("Fetching and converting...", "info"); // Will get 'info' style
-
-    try {
-      const res = await fetch("/api/convert", {
-        method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ link }),
-      });
-      const data = await res.json();
 
-      if (res.ok) {
-        if (data.guessed_headers) {
-          log(
-            `Guessed headers\n→ Name: "${data.guessed_headers.name}"\n→ Birthday: "${data.guessed_headers.birthday}"`,
-            "info"
-          );
-        }
-        dlLink.href = data.file;
-        dlLink.style.display = "block";
-        log("Conversion successful. You can now download the file.", "success");
-      } else {
-        log(`Error: ${data.error}`, "error");
-      }
-    } catch (e) {
-      log(`Network or server error: ${e.message}`, "error");
-    }
+    const source = new EventSource(
+      `/api/convert/events?link=${encodeURIComponent(link)}`
+    );
+    source.onmessage = (message) => {
+      if (logStage(JSON.parse(message.data))) source.close();
+    };
+    source.onerror = () => {
+      // EventSource reconnects by default; a conversion should not be retried.
+      source.close();
+      log("Network or server error: lost connection to the server.", "error");
+    };
   }
 
   /**
@@ -0,0 +1,53 @@
+"""Artifact stores: reconverting a sheet keeps its download alive for another full TTL."""
+import os
+import time
+
+import pytest
+
+import complendar
+from complendar import DiskArtifactStore, MemoryArtifactStore, TieredArtifactStore
+
+NAME = "complendar_0123.ics"
+
+
+def test_memory_touch_restarts_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(complendar.time, "monotonic", lambda: now[0])
+    store = MemoryArtifactStore(max_bytes=1024, ttl=60)
+    assert not store.touch(NAME)
+    store.put(NAME, b"ics")
+    now[0] += 50
+    assert store.touch(NAME)
+    now[0] += 50
+    assert store.get(NAME) == b"ics"
+    now[0] += 61
+    assert not store.touch(NAME)
+
+
+def test_disk_touch_restarts_ttl(tmp_path):
+    store = DiskArtifactStore(tmp_path, max_bytes=1024, ttl=60)
+    assert not store.touch(NAME)
+    store.put(NAME, b"ics")
+    os.utime(tmp_path / NAME, (time.time() - 50,) * 2)
+    assert store.touch(NAME)
+    assert (tmp_path / NAME).stat().st_mtime > time.time() - 10
+    os.utime(tmp_path / NAME, (time.time() - 61,) * 2)
+    assert not store.touch(NAME)
+
+
+def test_publish_refreshes_existing_artifact(tmp_path):
+    store = TieredArtifactStore(MemoryArtifactStore(1024, 60), DiskArtifactStore(tmp_path, 1024, 60))
+    conversion = complendar.Conversion("BEGIN:VCALENDAR\nEND:VCALENDAR\n", ("Name", "Birthday"), digest="")
+    name = complendar._publish_conversion(conversion, store)["file"].rsplit("/", 1)[-1]
+    os.utime(tmp_path / name, (time.time() - 50,) * 2)
+    complendar._publish_conversion(conversion, store)
+    assert (tmp_path / name).stat().st_mtime > time.time() - 10
+
+
+def test_incomplete_store_fails_when_created():
+    class WriteOnly(complendar.ArtifactStore):
+        def put(self, name, data):
+            pass
+
+    with pytest.raises(TypeError):
+        WriteOnly()
@@ -0,0 +1,59 @@
+"""`_parse_birthday` must accept and reject exactly what `strptime("%m/%d/%Y")` does."""
+import itertools
+
+import pytest
+
+from benchmarks.bench_birthday import _strptime_birthday
+from complendar import _parse_birthday
+
+EDGE_CASES = [
+    None,
+    "",
+    "1/ 5/2000",  # space-padded day, which strptime accepts
+    "1/5 /2000",
+    " 1/5/2000",
+    "1/5/2000 ",  # trailing whitespace
+    "1/5/2000\n",
+    "0/5/2000",
+    "00/5/2000",
+    "1/0/2000",
+    "1/00/2000",
+    "13/5/2000",
+    "1/32/2000",
+    "2/29/2000",
+    "2/29/2001",
+    "4/31/2000",
+    "001/5/2000",
+    "+1/5/2000",
+    "-1/5/2000",
+    "1/5/200",
+    "1/5/20000",
+    "1/5/0000",
+    "1/5/0001",
+    "12/31/9999",
+    "1/5/٢٠٠٠",  # non-ASCII digits in the year
+    "١/5/2000",  # and in the month
+    "1/٥/2000",
+    "１/5/2000",  # fullwidth
+    "1/5",
+    "1/5/2000/",
+    "not a date",
+]
+
+# Every combination of these catches quirks no hand-picked list thought of.
+MONTHS_AND_DAYS = ["", "0", "00", "1", "01", " 1", "1 ", "9", "10", "12", "13", "29", "30", "31", "32", "٣", "+1", "001"]
+YEARS = ["2000", "2001", "0000", "0001", "200", "20000", "٢٠٠٠", " 2000", "2000 "]
+
+
+@pytest.mark.parametrize("birthday", EDGE_CASES)
+def test_matches_strptime_on_edge_cases(birthday):
+    assert _parse_birthday(birthday) == _strptime_birthday(birthday)
+
+
+def test_matches_strptime_on_every_combination():
+    mismatches = [
+        birthday
+        for month, day, year in itertools.product(MONTHS_AND_DAYS, MONTHS_AND_DAYS, YEARS)
+        if _parse_birthday(birthday := f"{month}/{day}/{year}") != _strptime_birthday(birthday)
+    ]
+    assert mismatches == []
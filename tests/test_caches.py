@@ -0,0 +1,38 @@
+"""Cached calendars must stay within their byte budgets."""
+import complendar
+from complendar import Conversion, ConversionCache
+
+
+def _conversion(digest: str, size: int) -> Conversion:
+    return Conversion("x" * size, ("Name", "Birthday"), digest)
+
+
+def test_conversion_cache_evicts_by_bytes():
+    cache = ConversionCache(max_entries=10, max_bytes=100)
+    for digest in "abc":
+        cache.put(_conversion(digest, 40))
+    assert cache.peek("a") is None
+    assert cache.peek("b") is not None and cache.peek("c") is not None
+    assert cache.stats()["bytes"] == 80
+
+
+def test_conversion_cache_keeps_the_newest_calendar_over_budget():
+    cache = ConversionCache(max_entries=10, max_bytes=100)
+    cache.put(_conversion("a", 10))
+    cache.put(_conversion("b", 500))
+    assert cache.peek("a") is None
+    assert cache.peek("b") is not None
+
+
+def test_sheet_cache_forgets_validators_of_evicted_calendars(monkeypatch):
+    cache = ConversionCache(max_entries=1, max_bytes=100)
+    monkeypatch.setattr(complendar, "_conversion_cache", cache)
+    monkeypatch.setattr(complendar, "_sheet_cache", type(complendar._sheet_cache)())
+    key = ("sheet", "0")
+    cache.put(_conversion("a", 10))
+    complendar._store_sheet(key, complendar._CachedSheet('"etag"', None, cache.peek("a")))
+    assert complendar._cached_sheet(key).conversion.digest == "a"
+
+    cache.put(_conversion("b", 10))
+    assert complendar._cached_sheet(key) is None
+    assert key not in complendar._sheet_cache
@@ -0,0 +1,77 @@
+"""Golden-file tests: the built-in serializer must write exactly what ical writes.
+
+After an intentional change to the event template, regenerate the fixture from the ical
+output with `python -m tests.test_ics`.
+"""
+import re
+from datetime import date
+from pathlib import Path
+
+import complendar
+from complendar import Entry
+
+GOLDEN = Path(__file__).parent / "golden" / "birthdays.ics"
+DTSTAMP = "20240101T000000Z"
+
+ENTRIES = [
+    Entry("Ada Lovelace", date(1815, 12, 10)),
+    Entry("James", date(1990, 1, 1)),  # possessive without a trailing s
+    Entry('O\'Brien, Jr.; "Danny" \\ the 2nd', date(1985, 7, 4)),  # TEXT escapes
+    Entry("Line\nbreak\ttab\x07bell\x7f", date(2000, 2, 29)),  # newline and control characters
+    Entry("Bartholomew Maximilian Fitzgerald-Worthington the Third of Upper Snodsbury", date(1970, 3, 15)),
+    Entry("佐藤 花子 " * 6 + "🎉🎂", date(1999, 12, 31)),  # multi-byte characters across folds
+    Entry("Zoë Ñúñez-Łukasiewicz " * 3, date(2001, 10, 9)),
+    None,  # rows without a valid birthday are skipped
+]
+
+
+def _golden() -> str:
+    # Read bytes so that no newline translation can hide a difference.
+    return GOLDEN.read_bytes().decode("utf-8")
+
+
+def _fixed_dtstamp(ics: str) -> str:
+    return re.sub(r"DTSTAMP:\d{8}T\d{6}Z", f"DTSTAMP:{DTSTAMP}", ics)
+
+
+def test_ical_matches_golden():
+    assert _fixed_dtstamp(complendar._convert_entries_to_ics(ENTRIES, native=False)) == _golden()
+
+
+def test_native_matches_golden():
+    ics = complendar._convert_entries_to_ics(ENTRIES, native=True, parallel=False)
+    assert _fixed_dtstamp(ics) == _golden()
+
+
+def test_native_parallel_matches_golden(monkeypatch):
+    monkeypatch.setattr(complendar, "PARALLEL_RENDER_MIN_ROWS", 1)
+    monkeypatch.setattr(complendar, "RENDER_CHUNK_SIZE", 3)
+    ics = complendar._convert_entries_to_ics(ENTRIES, native=True)
+    assert _fixed_dtstamp(ics) == _golden()
+
+
+def test_native_vevent_with_fixed_dtstamp():
+    vevents = [e.to_ics(DTSTAMP) for e in ENTRIES if e]
+    assert "\n".join(vevents) in _golden()
+
+
+def test_large_calendars_render_in_parallel_without_native_ics(monkeypatch):
+    monkeypatch.setattr(complendar, "NATIVE_ICS", False)
+    monkeypatch.setattr(complendar, "PARALLEL_RENDER_MIN_ROWS", 1)
+    monkeypatch.setattr(complendar, "RENDER_CHUNK_SIZE", 3)
+    pieces = list(complendar._iter_ics(ENTRIES))
+    assert len(pieces) > 1  # ical would have yielded the whole calendar at once
+    assert _fixed_dtstamp("".join(pieces)) == _golden()
+
+
+def test_reconversions_by_default_only_render_new_rows():
+    complendar.Entry._ics_body.cache_clear()
+    complendar._convert_entries_to_ics(ENTRIES)
+    changed = [*ENTRIES[:-2], Entry("Someone New", date(1980, 5, 5))]
+    complendar._convert_entries_to_ics(changed)
+    assert complendar.Entry._ics_body.cache_info().misses == len([e for e in ENTRIES if e]) + 1
+
+
+if __name__ == "__main__":
+    GOLDEN.write_bytes(_fixed_dtstamp(complendar._convert_entries_to_ics(ENTRIES, native=False)).encode("utf-8"))
+    print(f"Wrote {GOLDEN}")
@@ -0,0 +1,33 @@
+"""A render pool whose worker died must not break later conversions."""
+import os
+import re
+import signal
+from datetime import date
+
+import complendar
+from complendar import Entry
+
+ENTRIES = [Entry(f"Person {i}", date(1990, 1 + i % 12, 1 + i % 28)) for i in range(12)]
+
+
+def _without_dtstamp(ics: str) -> str:
+    return re.sub(r"DTSTAMP:\d{8}T\d{6}Z", "", ics)
+
+
+def test_conversions_survive_a_killed_worker(monkeypatch):
+    monkeypatch.setattr(complendar, "_render_pool", None)
+    monkeypatch.setattr(complendar, "PARALLEL_RENDER_MIN_ROWS", 1)
+    monkeypatch.setattr(complendar, "RENDER_CHUNK_SIZE", 3)
+    expected = _without_dtstamp(complendar._convert_entries_to_ics(ENTRIES, native=True, parallel=False))
+    assert _without_dtstamp(complendar._convert_entries_to_ics(ENTRIES)) == expected
+
+    pool = complendar._render_pool
+    worker = next(iter(pool._processes.values()))
+    os.kill(worker.pid, signal.SIGKILL)  # as the OOM killer would
+    worker.join()
+
+    # The conversion that finds the pool broken finishes serially, the next one gets a new pool.
+    assert _without_dtstamp(complendar._convert_entries_to_ics(ENTRIES)) == expected
+    assert _without_dtstamp(complendar._convert_entries_to_ics(ENTRIES)) == expected
+    assert complendar._render_pool is not pool
+    complendar._render_pool.shutdown()
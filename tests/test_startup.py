@@ -0,0 +1,13 @@
+"""The startup budget from `benchmarks.bench_startup`, checked on every test run."""
+import statistics
+
+from benchmarks import bench_startup
+
+
+def test_import_is_within_budget():
+    median = statistics.median(bench_startup._import_time_ms() for _ in range(5))
+    assert median <= bench_startup.DEFAULT_BUDGET_MS
+
+
+def test_optional_dependencies_are_imported_on_demand():
+    assert bench_startup._eagerly_imported() == []